@@ -20,6 +20,11 @@ class CompositeCodecContext(DataCodecContext):
         self._values = []
         self._stack = []
 
+    def clear(self) -> None:
+        self.length = 0
+        self._values.clear()
+        self._stack.clear()
+
     def append_value(self, value) -> None:
         self._values.append(value)
 
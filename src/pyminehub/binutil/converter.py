@@ -2,7 +2,7 @@ import base64
 import struct
 from binascii import hexlify, unhexlify
 from enum import Enum
-from typing import NamedTuple as _NamedTuple, Callable, Dict, Generic, Optional, Type
+from typing import NamedTuple as _NamedTuple, Callable, Dict, Generic, Optional, Tuple, Type
 
 from pyminehub.typevar import T, BT, ET
 
@@ -771,6 +771,8 @@ class VarIntData(DataCodec[int]):
     b''
     """
 
+    _MAX_SHIFT = 64  # up to 10 bytes, enough for 64-bit values
+
     def __init__(self, unsigned: bool=True) -> None:
         self._unsigned = unsigned
 
@@ -806,6 +808,39 @@ class VarIntData(DataCodec[int]):
             shift += 7
         return value if self._unsigned else self._exchange_for_reading(value)
 
+    def read_from(self, data: bytes, offset: int) -> Tuple[int, int]:
+        """Read value at offset without consuming data.
+
+        >>> c = VarIntData()
+        >>> c.read_from(unhexlify(b'007f8001'), 2)
+        (128, 4)
+        >>> c.read_from(unhexlify(b'0080'), 1)  # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+          ...
+        BytesOperationError: Invalid data format. (offset = 2)
+        >>> c.read_from(unhexlify(b'ffffffffffffffffffff01'), 0)  # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+          ...
+        BytesOperationError: Too long VarInt. (offset = 0)
+
+        :return: the value and the offset that follows it
+        """
+        start = offset
+        value = 0
+        shift = 0
+        while True:
+            if offset >= len(data):
+                raise BytesOperationError('Invalid data format. (offset = {})'.format(offset))
+            if shift >= self._MAX_SHIFT:
+                raise BytesOperationError('Too long VarInt. (offset = {})'.format(start))
+            d = data[offset]
+            offset += 1
+            value += (d & 0x7f) << shift
+            if d & 0x80 == 0:
+                break
+            shift += 7
+        return (value if self._unsigned else self._exchange_for_reading(value)), offset
+
     def write(self, data: bytearray, value: int, context: DataCodecContext) -> None:
         if not self._unsigned:
             value = self._exchange_for_writing(value)
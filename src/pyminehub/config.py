@@ -7,11 +7,18 @@
 >>> reset()
 >>> get_value(ConfigKey.BATCH_COMPRESS_THRESHOLD)
 256
+>>> values = []
+>>> add_listener(ConfigKey.BATCH_COMPRESS_THRESHOLD, values.append)
+>>> set_config(batch_compress_threshold=128)
+>>> reset()
+>>> values
+[256, 128, 256]
 """
+from collections import defaultdict
 from enum import Enum
 from logging import getLogger
 from random import randrange
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterable, List
 
 from pyminehub.typevar import T
 
@@ -20,6 +27,7 @@ __all__ = [
     'reset',
     'set_config',
     'get_value',
+    'add_listener',
     'print_config'
 ]
 
@@ -47,6 +55,7 @@ class ConfigKey(Enum):
     CLOCK_TICK_TIME = 308
     INIT_SPACE = 309
     PLAYER_SPAWN_POSITION = 310
+    CHUNK_CACHE_SIZE = 311
     # raknet and mcpe.world
     WORLD_NAME = 401
     GAME_MODE = 402
@@ -72,6 +81,7 @@ __default_config = (
     (ConfigKey.CLOCK_TICK_TIME, 10.0),  # seconds
     (ConfigKey.INIT_SPACE, (32, 32)),  # size of space area or None if it generate space on demand
     (ConfigKey.PLAYER_SPAWN_POSITION, (256, 56, 256)),
+    (ConfigKey.CHUNK_CACHE_SIZE, 1024),  # number of chunks kept in memory, unlimited if value is None
     (ConfigKey.WORLD_NAME, 'PyMineHub'),
     (ConfigKey.GAME_MODE, 'SURVIVAL'),  # see mcpe.const.GameMode
     (ConfigKey.BATCH_COMPRESS_THRESHOLD, 256),  # bytes, compress if exceeded
@@ -80,21 +90,38 @@ __default_config = (
 
 _config = dict(__default_config)  # type: Dict[ConfigKey, Any]
 
+_listeners = defaultdict(list)  # type: Dict[ConfigKey, List[Callable[[Any], None]]]
+
+
+def _notify(keys: Iterable[ConfigKey]) -> None:
+    for key in keys:
+        for listener in _listeners.get(key, ()):
+            listener(_config[key])
+
 
 def reset() -> None:
     _config.clear()
     _config.update(__default_config)
     set_config(server_guid=randrange(1 << (8 * 8)))  # long range
+    _notify(key for key, _ in __default_config if key is not ConfigKey.SERVER_GUID)
 
 
 def set_config(**kwargs) -> None:
-    _config.update(dict((ConfigKey[key.upper()], value) for key, value in kwargs.items()))
+    config = dict((ConfigKey[key.upper()], value) for key, value in kwargs.items())
+    _config.update(config)
+    _notify(config)
 
 
 def get_value(key: ConfigKey) -> T:
     return _config[key]
 
 
+def add_listener(key: ConfigKey, listener: Callable[[Any], None]) -> None:
+    """Call listener with the current value, and again with new value whenever it is set."""
+    _listeners[key].append(listener)
+    listener(_config[key])
+
+
 def print_config(*target: ConfigKey) -> None:
     for key in target:
         _logger.info('%s=%s', key.name, get_value(key))
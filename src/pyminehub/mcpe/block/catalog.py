@@ -5,6 +5,12 @@ __all__ = [
     'block_specs'
 ]
 
+# specs without per block type state are shared by the block types that have the same behaviour
+_banner_spec = BlockSpec(ItemType.BANNER)
+_sign_spec = BlockSpec(ItemType.SIGN)
+_daylight_detector_spec = DaylightDetectorBlockSpec(ItemType.DAYLIGHT_DETECTOR)
+_liquid_spec = BlockSpec(None, can_pass=True, can_be_broken=False)
+
 block_specs = {
     BlockType.AIR: AirBlockSpec(),
     BlockType.BEDROCK: BlockSpec(None, can_be_broken=False),
@@ -26,12 +32,12 @@ block_specs = {
     BlockType.WOODEN_BUTTON: ToggleBlockSpec(ItemType.WOODEN_BUTTON),
     BlockType.STONE_BUTTON: ToggleBlockSpec(ItemType.STONE_BUTTON),
     BlockType.TRIPWIRE_HOOK: TripwireHookBlockSpec(ItemType.TRIPWIRE_HOOK),
-    BlockType.DAYLIGHT_DETECTOR: DaylightDetectorBlockSpec(ItemType.DAYLIGHT_DETECTOR),
-    BlockType.DAYLIGHT_DETECTOR_INVERTED: DaylightDetectorBlockSpec(ItemType.DAYLIGHT_DETECTOR),
-    BlockType.STANDING_BANNER: BlockSpec(ItemType.BANNER),
-    BlockType.WALL_BANNER: BlockSpec(ItemType.BANNER),
-    BlockType.STANDING_SIGN: BlockSpec(ItemType.SIGN),
-    BlockType.WALL_SIGN: BlockSpec(ItemType.SIGN),
+    BlockType.DAYLIGHT_DETECTOR: _daylight_detector_spec,
+    BlockType.DAYLIGHT_DETECTOR_INVERTED: _daylight_detector_spec,
+    BlockType.STANDING_BANNER: _banner_spec,
+    BlockType.WALL_BANNER: _banner_spec,
+    BlockType.STANDING_SIGN: _sign_spec,
+    BlockType.WALL_SIGN: _sign_spec,
     BlockType.TORCH: TorchBlockSpec(ItemType.TORCH),
     BlockType.REDSTONE_TORCH: TorchBlockSpec(ItemType.REDSTONE_TORCH),
     BlockType.RAIL: RailBlockSpec(ItemType.RAIL),
@@ -42,9 +48,9 @@ block_specs = {
     BlockType.TRAPPED_CHEST: ChestBlockSpec(ItemType.TRAPPED_CHEST),
     BlockType.ENDER_CHEST: ChestBlockSpec(ItemType.ENDER_CHEST),
     BlockType.WEB: BlockSpec(ItemType.WEB, can_pass=True),
-    BlockType.WATER: BlockSpec(None, can_pass=True, can_be_broken=False),
-    BlockType.FLOWING_WATER: BlockSpec(None, can_pass=True, can_be_broken=False),
-    BlockType.FLOWING_LAVA: BlockSpec(None, can_pass=True, can_be_broken=False),
+    BlockType.WATER: _liquid_spec,
+    BlockType.FLOWING_WATER: _liquid_spec,
+    BlockType.FLOWING_LAVA: _liquid_spec,
 }
 
 
@@ -1,4 +1,4 @@
-from typing import List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from pyminehub.mcpe.block.catalog import block_specs
 from pyminehub.mcpe.const import BlockType
@@ -11,11 +11,40 @@ __all__ = [
 
 
 class FunctionalBlock:
-    """Functional block joins block value and block specification"""
-
-    def __init__(self, block: Block) -> None:
-        self._block = block
-        self._block_spec = block_specs[block.type]
+    """Functional block joins block value and block specification
+
+    Instances are immutable, so the same instance is shared by equal blocks.
+
+    >>> block = Block.create(BlockType.DIRT, 0)
+    >>> FunctionalBlock(block) is FunctionalBlock(Block.create(BlockType.DIRT, 0))
+    True
+    """
+
+    __slots__ = (
+        '_block',
+        '_block_spec',
+        '_items',
+        'has_layer',
+        'can_be_broken',
+        'can_be_attached_on_ground',
+        'is_switchable'
+    )
+
+    _instances = {}  # type: Dict[Block, FunctionalBlock]
+
+    def __new__(cls, block: Block) -> 'FunctionalBlock':
+        instance = cls._instances.get(block)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance._block = block
+            instance._block_spec = block_spec = block_specs[block.type]
+            instance._items = None
+            instance.has_layer = block_spec.has_layer
+            instance.can_be_broken = block_spec.can_be_broken
+            instance.can_be_attached_on_ground = block_spec.can_be_attached_on_ground
+            instance.is_switchable = block_spec.is_switchable
+            cls._instances[block] = instance
+        return instance
 
     def __str__(self) -> str:
         return str(self._block)
@@ -28,26 +57,10 @@ class FunctionalBlock:
     def value(self) -> Block:
         return self._block
 
-    @property
-    def has_layer(self) -> bool:
-        return self._block_spec.has_layer
-
     @property
     def can_pass(self) -> bool:
         return self._block_spec.can_pass(self._block)
 
-    @property
-    def can_be_broken(self) -> bool:
-        return self._block_spec.can_be_broken
-
-    @property
-    def can_be_attached_on_ground(self) -> bool:
-        return self._block_spec.can_be_attached_on_ground
-
-    @property
-    def is_switchable(self) -> bool:
-        return self._block_spec.is_switchable
-
     @property
     def is_on(self) -> bool:
         return self._block_spec.is_on(self._block)
@@ -65,7 +78,11 @@ class FunctionalBlock:
         return self._block_spec.get_break_target(self._block)
 
     def to_item(self) -> List[Item]:
-        return self._block_spec.to_item(self._block.data)
+        items = self._items
+        if items is None:
+            # items are immutable, so they are created once and shared by the returned lists
+            items = self._items = tuple(self._block_spec.to_item(self._block.data))
+        return list(items)
 
     def stack_on(self, base_block: Block, face: Face) -> Optional[Block]:
         return self._block_spec.stack_layer(base_block, self._block, face)
@@ -74,15 +91,20 @@ class FunctionalBlock:
         return self._block_spec.switch(self._block)
 
     def can_be_attached_on(self, base_block: Block, face: Face) -> bool:
-        if face.inverse not in self._block_spec.male_connector(self._block):
+        block_spec = self._block_spec
+        if face.inverse not in block_spec.male_connector(self._block):
             return False
-        base_block_spec = block_specs[base_block.type]
-        if face not in base_block_spec.female_connector(base_block):
+        if face not in block_specs[base_block.type].female_connector(base_block):
             return False
-        return self._block_spec.can_be_attached_on(base_block)
+        return block_spec.can_be_attached_on(base_block)
 
     def get_additional_blocks(self, linked_blocks: Sequence[Block]) -> Tuple[PlacedBlock, ...]:
         return self._block_spec.get_additional_blocks(self._block, linked_blocks)
 
     def can_be_overridden_by(self, block: Block) -> bool:
         return self._block_spec.can_be_overridden_by(block)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest_result = doctest.testmod()
@@ -37,10 +37,38 @@ _CONNECTOR_EAST = frozenset([Face.EAST])
 _CONNECTOR_WEST = frozenset([Face.WEST])
 _CONNECTOR_SIDE = frozenset([Face.SOUTH, Face.NORTH, Face.EAST, Face.WEST])
 _CONNECTOR_ALL = frozenset([Face.BOTTOM, Face.TOP, Face.SOUTH, Face.NORTH, Face.EAST, Face.WEST])
+_CONNECTOR_ALL_BUT_BOTTOM = _CONNECTOR_ALL - _CONNECTOR_BOTTOM
+_CONNECTOR_ALL_BUT_TOP = _CONNECTOR_ALL - _CONNECTOR_TOP
+
+_ORIGIN = Vector3(0, 0, 0)
+_ABOVE = Vector3(0, 1, 0)
+_BELOW = Vector3(0, -1, 0)
+_ORIGIN_ONLY = (_ORIGIN,)
+
+
+def _flip_data(block: Block, mask: int) -> Block:
+    """Return the block whose data bits in mask are inverted, keeping its flags.
+
+    >>> block = Block.create(BlockType.LEVER, 2, neighbors=True)
+    >>> _flip_data(block, 0b1000) == block.copy(data=block.data ^ 0b1000)
+    True
+    """
+    assert mask <= 0xf
+    return Block(block.type, block.aux_value ^ mask)
 
 
 class BlockSpec:
 
+    __slots__ = (
+        'item_type',
+        'max_layer_num',
+        'has_layer',
+        'can_be_broken',
+        'can_be_attached_on_ground',
+        'is_switchable',
+        '_can_pass'
+    )
+
     def __init__(
             self,
             item_type: Optional[ItemType],
@@ -50,39 +78,17 @@ class BlockSpec:
             can_be_attached_on_ground: bool=False,
             is_switchable: bool=False
     ) -> None:
-        self._item_type = item_type
-        self._max_layer_num = max_layer_num
-        self._can_be_broken = can_be_broken
+        # plain attributes rather than read-only properties, as they are read on every block operation
+        self.item_type = item_type
+        self.max_layer_num = max_layer_num
+        self.has_layer = max_layer_num > 1
+        self.can_be_broken = can_be_broken
         self._can_pass = can_pass
-        self._can_be_attached_on_ground = can_be_attached_on_ground
-        self._is_switchable = is_switchable
-
-    @property
-    def item_type(self) -> Optional[ItemType]:
-        return self._item_type
-
-    @property
-    def has_layer(self) -> bool:
-        return self._max_layer_num > 1
-
-    @property
-    def max_layer_num(self) -> int:
-        return self._max_layer_num
-
-    @property
-    def can_be_broken(self) -> bool:
-        return self._can_be_broken
-
-    @property
-    def can_be_attached_on_ground(self) -> bool:
-        return self._can_be_attached_on_ground
-
-    @property
-    def is_switchable(self) -> bool:
-        return self._is_switchable
+        self.can_be_attached_on_ground = can_be_attached_on_ground
+        self.is_switchable = is_switchable
 
     def is_on(self, block: Block) -> bool:
-        assert self._is_switchable
+        assert self.is_switchable
         return False
 
     def can_pass(self, block: Block) -> bool:
@@ -95,24 +101,24 @@ class BlockSpec:
         return ()
 
     def get_break_target(self, block: Block) -> Tuple[Vector3[int], ...]:
-        return Vector3(0, 0, 0),
+        return _ORIGIN_ONLY
 
     def to_item(self, block_data: int) -> List[Item]:
         return [Item.create(self.item_type, 1, block_data)] if self.item_type is not None else []
 
     def stack_layer(self, base_block: Block, stacked_block: Block, face: Face) -> Optional[Block]:
-        assert self.has_layer > 1
+        assert self.has_layer
         return None
 
     def get_switch_position(self, block: Block) -> Vector3[int]:
-        return Vector3(0, 0, 0)
+        return _ORIGIN
 
     def switch(self, block: Block) -> Block:
         assert self.is_switchable
         return block
 
     def get_additional_blocks(self, block: Block, linked_blocks: Sequence[Block]) -> Tuple[PlacedBlock, ...]:
-        return PlacedBlock(Vector3(0, 0, 0), block),
+        return PlacedBlock(_ORIGIN, block),
 
     def female_connector(self, block: Block) -> _Connector:
         return _CONNECTOR_ALL
@@ -126,6 +132,8 @@ class BlockSpec:
 
 class AirBlockSpec(BlockSpec):
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(None, can_be_broken=False, can_pass=True)
 
@@ -141,6 +149,8 @@ class AirBlockSpec(BlockSpec):
 
 class ToExtendUpwardBlockSpec(BlockSpec):
 
+    __slots__ = ()
+
     def female_connector(self, block: Block) -> _Connector:
         return _CONNECTOR_NONE
 
@@ -150,6 +160,8 @@ class ToExtendUpwardBlockSpec(BlockSpec):
 
 class SlabBlockSpec(BlockSpec):
 
+    __slots__ = ('_full_stacked_block_type',)
+
     _SLAB_TYPE_MASK = 0b111
     _IS_UPPER_MASK = 0b1000
 
@@ -175,31 +187,30 @@ class SlabBlockSpec(BlockSpec):
         ...     Block.create(block_type, 0, neighbors=True), Block.create(block_type, 8, neighbors=False), Face.TOP)
         Block(type=<BlockType.DOUBLE_WOODEN_SLAB: 157>, aux_value=0)
         """
-        slab_type = stacked_block.data & self._SLAB_TYPE_MASK
-        if slab_type != base_block.data & self._SLAB_TYPE_MASK:
+        base_data = base_block.data
+        stacked_data = stacked_block.data
+        slab_type = stacked_data & self._SLAB_TYPE_MASK
+        if slab_type != base_data & self._SLAB_TYPE_MASK:
             return base_block
-        is_upper = stacked_block.data & self._IS_UPPER_MASK
-        if is_upper != base_block.data & self._IS_UPPER_MASK:
+        is_upper = stacked_data & self._IS_UPPER_MASK
+        if is_upper != base_data & self._IS_UPPER_MASK:
             if (face is Face.BOTTOM and is_upper) or (face is Face.TOP and not is_upper):
                 return None
-            return Block.create(self._full_stacked_block_type, slab_type, **stacked_block.flags)
+            # keep the flags of stacked block, replacing type and data
+            return Block(self._full_stacked_block_type, stacked_block.aux_value & ~0xf | slab_type)
         return None
 
     def female_connector(self, block: Block) -> _Connector:
-        if block.data & self._IS_UPPER_MASK:
-            return _CONNECTOR_ALL - _CONNECTOR_BOTTOM
-        else:
-            return _CONNECTOR_ALL - _CONNECTOR_TOP
+        return _CONNECTOR_ALL_BUT_BOTTOM if block.data & self._IS_UPPER_MASK else _CONNECTOR_ALL_BUT_TOP
 
-    def male_connector(self, block: Block):
-        if block.data & self._IS_UPPER_MASK:
-            return _CONNECTOR_ALL - _CONNECTOR_BOTTOM
-        else:
-            return _CONNECTOR_ALL - _CONNECTOR_TOP
+    def male_connector(self, block: Block) -> _Connector:
+        return _CONNECTOR_ALL_BUT_BOTTOM if block.data & self._IS_UPPER_MASK else _CONNECTOR_ALL_BUT_TOP
 
 
 class SnowLayerBlockSpec(ToExtendUpwardBlockSpec):
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(None, max_layer_num=8, can_pass=True, can_be_attached_on_ground=True)
 
@@ -225,7 +236,9 @@ class SnowLayerBlockSpec(ToExtendUpwardBlockSpec):
 
 class LadderBlockSpec(BlockSpec):
 
-    _CAN_BE_ATTACHED = (
+    __slots__ = ()
+
+    _CAN_BE_ATTACHED = frozenset((
         BlockType.PLANKS,
 
         BlockType.BRICK_BLOCK,
@@ -320,15 +333,17 @@ class LadderBlockSpec(BlockSpec):
         BlockType.OBSERVER,
         BlockType.PISTON,
         BlockType.STICKY_PISTON,
+    ))
+
+    _CONNECTOR = (  # indexed by block data
+        _CONNECTOR_NONE,
+        _CONNECTOR_NONE,
+        _CONNECTOR_NORTH,
+        _CONNECTOR_SOUTH,
+        _CONNECTOR_WEST,
+        _CONNECTOR_EAST
     )
 
-    _CONNECTOR = {
-        2: _CONNECTOR_NORTH,
-        3: _CONNECTOR_SOUTH,
-        4: _CONNECTOR_WEST,
-        5: _CONNECTOR_EAST
-    }
-
     def __init__(self) -> None:
         super().__init__(ItemType.LADDER, can_pass=True)
 
@@ -344,6 +359,8 @@ class LadderBlockSpec(BlockSpec):
 
 class FenceGateBlockSpec(ToExtendUpwardBlockSpec):
 
+    __slots__ = ()
+
     _DOES_OPEN_MASK = 0b100
 
     def __init__(self, item_type: Optional[ItemType]) -> None:
@@ -356,11 +373,13 @@ class FenceGateBlockSpec(ToExtendUpwardBlockSpec):
         return self.is_on(block)
 
     def switch(self, block: Block) -> Block:
-        return block.copy(data=block.data ^ self._DOES_OPEN_MASK)
+        return _flip_data(block, self._DOES_OPEN_MASK)
 
 
 class TrapDoorBlockSpec(BlockSpec):
 
+    __slots__ = ()
+
     _DOES_OPEN_MASK = 0b1000
 
     def __init__(self, item_type: Optional[ItemType]) -> None:
@@ -370,7 +389,7 @@ class TrapDoorBlockSpec(BlockSpec):
         return bool(block.data & self._DOES_OPEN_MASK)
 
     def switch(self, block: Block) -> Block:
-        return block.copy(data=block.data ^ self._DOES_OPEN_MASK)
+        return _flip_data(block, self._DOES_OPEN_MASK)
 
     def female_connector(self, block: Block) -> _Connector:
         return _CONNECTOR_NONE
@@ -381,29 +400,35 @@ class TrapDoorBlockSpec(BlockSpec):
 
 class CarpetBlockSpec(ToExtendUpwardBlockSpec):
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(ItemType.CARPET, can_pass=True, can_be_attached_on_ground=True)
 
 
 class DoublePlantBlockSpec(ToExtendUpwardBlockSpec):
 
+    __slots__ = ()
+
     _IS_UPPER_MASK = 0b1000
 
+    _BREAK_UPPER = _ORIGIN_ONLY
+    _BREAK_LOWER = (_ABOVE, _ORIGIN)
+
     def _is_upper(self, block: Block) -> bool:
         return bool(block.data & self._IS_UPPER_MASK)
 
     def get_break_target(self, block: Block) -> Tuple[Vector3[int], ...]:
-        if self._is_upper(block):
-            return Vector3(0, 0, 0),
-        else:
-            return Vector3(0, 1, 0), Vector3(0, 0, 0)
+        return self._BREAK_UPPER if self._is_upper(block) else self._BREAK_LOWER
 
     def get_additional_blocks(self, block: Block, linked_blocks: Sequence[Block]) -> Tuple[PlacedBlock, ...]:
-        return PlacedBlock(Vector3(0, 0, 0), block), PlacedBlock(Vector3(0, 1, 0), block.copy(data=self._IS_UPPER_MASK))
+        return PlacedBlock(_ORIGIN, block), PlacedBlock(_ABOVE, block.copy(data=self._IS_UPPER_MASK))
 
 
 class DoorBlockSpec(ToExtendUpwardBlockSpec):
 
+    __slots__ = ()
+
     # set to the upper part
     _IS_UPPER_MASK = 0b1000
     _IS_RIGHT_SIDE_MASK = 0b1
@@ -412,14 +437,15 @@ class DoorBlockSpec(ToExtendUpwardBlockSpec):
     _DOES_OPEN_MASK = 0b100
     _FACE_MASK = 0b11
 
-    _LEFT_SIDE = {
-        0: Vector3(0, 0, -1),
-        1: Vector3(1, 0, 0),
-        2: Vector3(0, 0, 1),
-        3: Vector3(-1, 0, 0)
-    }
+    _LEFT_SIDE = (  # indexed by face
+        Vector3(0, 0, -1),
+        Vector3(1, 0, 0),
+        Vector3(0, 0, 1),
+        Vector3(-1, 0, 0)
+    )
 
-    _BREAK_ORDER = (Vector3(0, 1, 0), Vector3(0, 0, 0))
+    _BREAK_UPPER = (_ORIGIN, _BELOW)
+    _BREAK_LOWER = (_ABOVE, _ORIGIN)
 
     def __init__(self, item_type: Optional[ItemType]) -> None:
         super().__init__(item_type, can_pass=True, is_switchable=True)
@@ -454,54 +480,66 @@ class DoorBlockSpec(ToExtendUpwardBlockSpec):
         return left_side, left_side + (0, 1, 0)
 
     def get_break_target(self, block: Block) -> Tuple[Vector3[int], ...]:
-        dy = -1 if self._is_upper_part(block) else 0
-        return tuple(p + (0, dy, 0) for p in self._BREAK_ORDER)
+        """
+        >>> spec = DoorBlockSpec(None)
+        >>> spec.get_break_target(Block.create(BlockType.WOODEN_DOOR_BLOCK, 0))
+        (Vector3(x=0, y=1, z=0), Vector3(x=0, y=0, z=0))
+        >>> spec.get_break_target(Block.create(BlockType.WOODEN_DOOR_BLOCK, 8))
+        (Vector3(x=0, y=0, z=0), Vector3(x=0, y=-1, z=0))
+        """
+        return self._BREAK_UPPER if self._is_upper_part(block) else self._BREAK_LOWER
 
     def get_switch_position(self, block: Block) -> Vector3[int]:
-        dy = -1 if self._is_upper_part(block) else 0
-        return Vector3(0, dy, 0)
+        return _BELOW if self._is_upper_part(block) else _ORIGIN
 
     def switch(self, block: Block) -> Block:
-        return block.copy(data=block.data ^ self._DOES_OPEN_MASK)
+        return _flip_data(block, self._DOES_OPEN_MASK)
 
     def get_additional_blocks(self, block: Block, linked_blocks: Sequence[Block]) -> Tuple[PlacedBlock, ...]:
         assert len(linked_blocks) == 2
         left_side_lower_block, left_side_upper_block = linked_blocks
         right_side_mask = 0
-        if left_side_lower_block.type == block.type and self._get_face(left_side_lower_block) == self._get_face(block):
+        if left_side_lower_block.type == block.type \
+                and left_side_lower_block.data & self._FACE_MASK == block.data & self._FACE_MASK:
             if not self._is_right_side(left_side_upper_block):
                 right_side_mask = self._IS_RIGHT_SIDE_MASK
         data = self._IS_UPPER_MASK | right_side_mask
-        return PlacedBlock(Vector3(0, 0, 0), block), PlacedBlock(Vector3(0, 1, 0), block.copy(data=data))
+        return PlacedBlock(_ORIGIN, block), PlacedBlock(_ABOVE, block.copy(data=data))
 
 
 class EndRodBlockSpec(BlockSpec):
 
-    _BASE_SIDE = {
-        0: Vector3(0, 1, 0),
-        1: Vector3(0, -1, 0),
-        2: Vector3(0, 0, -1),
-        3: Vector3(0, 0, 1),
-        4: Vector3(-1, 0, 0),
-        5: Vector3(1, 0, 0)
-    }
+    __slots__ = ()
+
+    _BASE_SIDE = (  # indexed by block data
+        Vector3(0, 1, 0),
+        Vector3(0, -1, 0),
+        Vector3(0, 0, -1),
+        Vector3(0, 0, 1),
+        Vector3(-1, 0, 0),
+        Vector3(1, 0, 0)
+    )
+
+    _LINK_TARGET = tuple((base_side,) for base_side in _BASE_SIDE)
 
     def __init__(self) -> None:
         super().__init__(ItemType.END_ROD)
 
     def get_link_target(self, block: Block) -> Tuple[Vector3[int], ...]:
-        return self._BASE_SIDE[block.data],
+        return self._LINK_TARGET[block.data]
 
     def get_additional_blocks(self, block: Block, linked_blocks: Sequence[Block]) -> Tuple[PlacedBlock, ...]:
         assert len(linked_blocks) == 1
         base_side_block = linked_blocks[0]
         if base_side_block.type == block.type and base_side_block.data == block.data:
-            block = block.copy(data=block.data ^ 1)
-        return PlacedBlock(Vector3(0, 0, 0), block),
+            block = _flip_data(block, 1)
+        return PlacedBlock(_ORIGIN, block),
 
 
 class ToggleBlockSpec(BlockSpec):
 
+    __slots__ = ()
+
     _TOGGLE_MASK = 0b1000
 
     def __init__(self, item_type: Optional[ItemType]) -> None:
@@ -511,7 +549,7 @@ class ToggleBlockSpec(BlockSpec):
         return bool(block.data & self._TOGGLE_MASK)
 
     def switch(self, block: Block) -> Block:
-        return block.copy(data=block.data ^ self._TOGGLE_MASK)
+        return _flip_data(block, self._TOGGLE_MASK)
 
     def female_connector(self, block: Block) -> _Connector:
         return _CONNECTOR_NONE
@@ -522,6 +560,8 @@ class ToggleBlockSpec(BlockSpec):
 
 class TripwireHookBlockSpec(BlockSpec):
 
+    __slots__ = ()
+
     def __init__(self, item_type: Optional[ItemType]) -> None:
         super().__init__(item_type, can_pass=True)
 
@@ -534,6 +574,8 @@ class TripwireHookBlockSpec(BlockSpec):
 
 class DaylightDetectorBlockSpec(BlockSpec):
 
+    __slots__ = ()
+
     def __init__(self, item_type: Optional[ItemType]) -> None:
         super().__init__(item_type, is_switchable=True)
 
@@ -554,6 +596,8 @@ class DaylightDetectorBlockSpec(BlockSpec):
 
 class TorchBlockSpec(BlockSpec):
 
+    __slots__ = ()
+
     def __init__(self, item_type: Optional[ItemType]) -> None:
         super().__init__(item_type, can_pass=True)
 
@@ -561,7 +605,7 @@ class TorchBlockSpec(BlockSpec):
         return _CONNECTOR_NONE
 
     def male_connector(self, block: Block) -> _Connector:
-        return _CONNECTOR_ALL - _CONNECTOR_TOP
+        return _CONNECTOR_ALL_BUT_TOP
 
 
 def _get_neighbour_position(center: Vector3[int]) -> Tuple[Vector3[int], ...]:
@@ -572,7 +616,7 @@ def _get_neighbour_position(center: Vector3[int]) -> Tuple[Vector3[int], ...]:
     )
 
 
-_NEIGHBOUR = _get_neighbour_position(Vector3(0, 0, 0))
+_NEIGHBOUR = _get_neighbour_position(_ORIGIN)
 _SURROUNDING = _NEIGHBOUR + tuple(set(p for p in _NEIGHBOUR for p in _get_neighbour_position(p)))
 
 _RailType = NamedTuple('RailType', [
@@ -605,7 +649,7 @@ class _RailNetwork:
 
     def __init__(self, linked_blocks: Iterator[Tuple[Vector3[int], Block]]) -> None:
         self._blocks = dict((position, block) for position, block in linked_blocks)
-        self._rail_positions = self.get_rail_positions_by_neighbour(Vector3(0, 0, 0))
+        self._rail_positions = self.get_rail_positions_by_neighbour(_ORIGIN)
 
     @property
     def has_rail_by_neighbour(self) -> bool:
@@ -650,6 +694,8 @@ class _RailNetwork:
 
 class RailBlockSpec(BlockSpec):
 
+    __slots__ = ()
+
     def __init__(self, item_type: Optional[ItemType]) -> None:
         super().__init__(item_type, can_pass=True, can_be_attached_on_ground=True)
 
@@ -662,7 +708,7 @@ class RailBlockSpec(BlockSpec):
     def get_additional_blocks(self, block: Block, linked_blocks: Sequence[Block]) -> Tuple[PlacedBlock, ...]:
         network = _RailNetwork(zip(_SURROUNDING, linked_blocks))
         data = self._get_block_data(network, block.type == BlockType.RAIL)
-        blocks = [PlacedBlock(Vector3(0, 0, 0), block.copy(data=data))]
+        blocks = [PlacedBlock(_ORIGIN, block.copy(data=data))]
         rail_type = _RAIL_TYPE[data]
         for connector in rail_type.connector:
             updated = self._update_neighbour(network, connector)
@@ -734,6 +780,8 @@ class RailBlockSpec(BlockSpec):
 
 class ChestBlockSpec(BlockSpec):
 
+    __slots__ = ()
+
     def female_connector(self, block: Block) -> _Connector:
         return _CONNECTOR_NONE
 
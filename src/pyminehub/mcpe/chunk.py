@@ -4,7 +4,8 @@ from typing import Callable, Iterator, List, Sequence
 from pyminehub.binutil.composite import CompositeCodec, VarListData, CompositeData
 from pyminehub.binutil.converter import RawData
 from pyminehub.binutil.instance import BYTE_DATA, VAR_INT_DATA, FALSE_DATA
-from pyminehub.mcpe.const import BlockType, BiomeType
+from pyminehub.mcpe.const import BlockType, BiomeType, block_type_from_id, biome_type_from_id
+from pyminehub.mcpe.const_int import BlockType_AIR
 from pyminehub.mcpe.geometry import ChunkGeometry, Vector3
 from pyminehub.mcpe.value import Block
 
@@ -40,6 +41,8 @@ _EMPTY_BLOCK_DATA = b'\00' * _layout['sub_chunk_block_data']
 _EMPTY_HEIGHT_MAP = b'\00' * _layout['chunk_height_map']
 _EMPTY_BIOME_ID = b'\00' * _layout['chunk_biome_id']
 
+_BLOCK_AIR = Block.create(BlockType.AIR, 0)
+
 
 class _SubChunk:
     """Chunk of ChunkGeometry.Sub.SHAPE blocks."""
@@ -62,7 +65,7 @@ class _SubChunk:
         return (x * ChunkGeometry.SHAPE.x + z) * ChunkGeometry.SHAPE.z + y
 
     def get_block_type(self, x: int, y: int, z: int) -> BlockType:
-        return BlockType(self._block_id[self._to_block_id_index(x, y, z)])
+        return block_type_from_id(self._block_id[self._to_block_id_index(x, y, z)])
 
     def set_block_type(self, x: int, y: int, z: int, block_type: BlockType) -> None:
         self._block_id[self._to_block_id_index(x, y, z)] = block_type.value
@@ -133,14 +136,13 @@ class Chunk:
     def get_block(self, position: Vector3[int]) -> Block:
         sub_chunk_index = position.y // self._Y_UNIT
         if sub_chunk_index >= len(self._sub_chunk):
-            block_type = BlockType.AIR
-            return Block.create(block_type, 0)  # TODO check data or aux_value
+            return _BLOCK_AIR  # TODO check data or aux_value
         else:
             sub_chunk = self._sub_chunk[sub_chunk_index]
             y_in_sub = position.y % self._Y_UNIT
             block_type = sub_chunk.get_block_type(position.x, y_in_sub, position.z)
             block_data = sub_chunk.get_block_data(position.x, y_in_sub, position.z)
-            return Block.create(block_type, block_data)
+            return Block(block_type, block_data)  # stored blocks have no flags, so aux_value is the data
 
     def set_block(self, position: Vector3[int], block: Block) -> None:
         sub_chunk_index = position.y // self._Y_UNIT
@@ -152,9 +154,9 @@ class Chunk:
         sub_chunk.set_block_type(position.x, y_in_sub, position.z, block.type)
         sub_chunk.set_block_data(position.x, y_in_sub, position.z, block.data)  # TODO check data or aux_value
         height = self.get_height(position.x, position.z)
-        if position.y == height and block.type != BlockType.AIR:
+        if position.y == height and block.type != BlockType_AIR:
             self.set_height(position.x, position.z, height + 1)
-        if position.y == height - 1 and block.type == BlockType.AIR:
+        if position.y == height - 1 and block.type == BlockType_AIR:
             self.set_height(position.x, position.z, height - 1)
         self._is_updated = True
 
@@ -173,7 +175,7 @@ class Chunk:
 
     def get_biome_id(self, x: int, z: int) -> BiomeType:
         index = x * ChunkGeometry.SHAPE.x + z
-        return BiomeType(self._biome_id[index])
+        return biome_type_from_id(self._biome_id[index])
 
     def set_biome_id(self, x: int, z: int, biome_type: BiomeType) -> None:
         index = x * ChunkGeometry.SHAPE.x + z
@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 __all__ = [
@@ -8,7 +8,7 @@ __all__ = [
 ]
 
 
-class CommandPermission(Enum):
+class CommandPermission(IntEnum):
     NORMAL = 0
     OPERATOR = 1
     HOST = 2
@@ -1,5 +1,6 @@
-from enum import Enum
+from enum import Enum, EnumMeta, IntEnum
 from itertools import chain
+from typing import Iterable, Tuple
 
 
 __all__ = [
@@ -13,6 +14,9 @@ __all__ = [
     'PlayerPermission',
     'AdventureSettingFlag1',
     'AdventureSettingFlag2',
+    'ADVENTURE_FLAG1_MASKS',
+    'ADVENTURE_FLAG2_MASKS',
+    'pack_adventure_flags',
     'AttributeType',
     'MetaDataType',
     'EntityMetaDataKey',
@@ -27,11 +31,29 @@ __all__ = [
     'SoundType',
     'PlayerActionType',
     'TextType',
+    'TEXT_TYPE_WITH_SOURCE',
+    'TEXT_TYPE_WITH_PARAMETERS',
     'EscapeSequence',
+    'ESCAPE_BY_NAME',
     'EntityEventType',
     'SourceType',
     'EntityType',
     'SpaceEventType',
+    'ENTITY_METADATA_FLAG_MASK',
+    'ENTITY_METADATA_FLAG_CLEAR_MASK',
+    'block_type_from_id',
+    'block_name',
+    'block_from_name',
+    'biome_type_from_id',
+    'BLOCK_TYPE_BY_ID',
+    'BLOCK_TYPE_BY_NAME',
+    'BLOCK_ID_TO_NAME',
+    'BLOCK_ALIASES',
+    'BIOME_TYPE_BY_ID',
+    'SOUND_TYPE_BY_ID',
+    'ENTITY_TYPE_BY_ID',
+    'ENTITY_META_KEY_BY_ID',
+    'PLAYER_ACTION_TYPE_BY_ID',
 ]
 
 
@@ -39,45 +61,80 @@ HOTBAR_SIZE = 9
 PLAYER_EYE_HEIGHT = 1.625
 
 
-class Dimension(Enum):
+class _FastEnumMeta(EnumMeta):
+    """Metaclass to look up members by value without going through `EnumMeta.__call__`.
+
+    >>> class Color(IntEnum, metaclass=_FastEnumMeta):
+    ...     RED = 0
+    ...     GREEN = 1
+    ...     BLUE = 2
+    >>> Color(1)
+    <Color.GREEN: 1>
+    >>> Color(3)
+    Traceback (most recent call last):
+      ...
+    ValueError: 3 is not a valid Color
+    """
+
+    def __new__(mcs, cls_name, bases, class_dict, **kwargs):
+        enum_cls = super().__new__(mcs, cls_name, bases, class_dict, **kwargs)
+        values = sorted(enum_cls._value2member_map_)
+        if values == list(range(len(values))):
+            enum_cls._value2member_list = tuple(enum_cls._value2member_map_[v] for v in values)
+        else:
+            enum_cls._value2member_list = None
+        return enum_cls
+
+    def __call__(cls, value, *args, **kwargs):
+        if args or kwargs:
+            return super().__call__(value, *args, **kwargs)
+        try:
+            if cls._value2member_list is not None and value >= 0:
+                return cls._value2member_list[value]
+            return cls._value2member_map_[value]
+        except (IndexError, KeyError, TypeError):
+            return super().__call__(value)
+
+
+class Dimension(IntEnum):
     OVERWORLD = 0
     NETHER = 1
     THE_END = 2
 
     
-class GeneratorType(Enum):
+class GeneratorType(IntEnum):
     OLD = 0
     INFINITE = 1
     FLAT = 2
 
 
-class GameMode(Enum):
+class GameMode(IntEnum):
     SURVIVAL = 0
     CREATIVE = 1
     ADVENTURE = 2
 
 
-class Difficulty(Enum):
+class Difficulty(IntEnum):
     PEACEFUL = 0
     EASY = 1
     NORMAL = 2
     HARD = 3
 
     
-class GameRuleType(Enum):
+class GameRuleType(IntEnum):
     BOOL = 1
     INT = 2
     FLOAT = 3
 
 
-class PlayerPermission(Enum):
+class PlayerPermission(IntEnum):
     CUSTOM = 3
     OPERATOR = 2
     MEMBER = 1
     VISITOR = 0
 
 
-class AdventureSettingFlag1(Enum):
+class AdventureSettingFlag1(IntEnum):
     WORLD_IMMUTABLE = 0
     NO_PVP = 1
     AUTO_JUMP = 5
@@ -88,7 +145,7 @@ class AdventureSettingFlag1(Enum):
     MUTED = 10
 
 
-class AdventureSettingFlag2(Enum):
+class AdventureSettingFlag2(IntEnum):
     BUILD_AND_MINE = 0
     DOORS_AND_SWITCHES = 1
     OPEN_CONTAINERS = 2
@@ -98,6 +155,35 @@ class AdventureSettingFlag2(Enum):
     TELEPORT = 7
 
 
+def _flag_masks(flag_cls) -> Tuple[int, ...]:
+    masks = [0] * (max(flag_cls) + 1)
+    for flag in flag_cls:
+        masks[flag] = 1 << flag
+    return tuple(masks)
+
+
+# indexed by flag value
+ADVENTURE_FLAG1_MASKS = _flag_masks(AdventureSettingFlag1)
+ADVENTURE_FLAG2_MASKS = _flag_masks(AdventureSettingFlag2)
+
+
+def pack_adventure_flags(
+        active_flags1: Iterable[AdventureSettingFlag1],
+        active_flags2: Iterable[AdventureSettingFlag2]
+) -> Tuple[int, int]:
+    """
+    >>> pack_adventure_flags((AdventureSettingFlag1.WORLD_IMMUTABLE, AdventureSettingFlag1.FLYING), ())
+    (513, 0)
+    """
+    flags1 = 0
+    for flag in active_flags1:
+        flags1 |= ADVENTURE_FLAG1_MASKS[flag]
+    flags2 = 0
+    for flag in active_flags2:
+        flags2 |= ADVENTURE_FLAG2_MASKS[flag]
+    return flags1, flags2
+
+
 class AttributeType(Enum):
     HEALTH = 'health'
     FOLLOW_RANGE = 'follow_range'
@@ -112,7 +198,7 @@ class AttributeType(Enum):
     PLAYER_EXPERIENCE = 'player.experience'
 
 
-class MetaDataType(Enum):
+class MetaDataType(IntEnum):
     BYTE = 0
     SHORT = 1
     INT = 2
@@ -124,7 +210,7 @@ class MetaDataType(Enum):
     FLOAT_VECTOR3 = 8
 
 
-class EntityMetaDataKey(Enum):
+class EntityMetaDataKey(IntEnum, metaclass=_FastEnumMeta):
     FLAGS = 0
     HEALTH = 1  # minecart/boat
     VARIANT = 2
@@ -202,7 +288,7 @@ class EntityMetaDataKey(Enum):
     # 78 (int)
 
 
-class EntityMetaDataFlag(Enum):
+class EntityMetaDataFlag(IntEnum):
     ONFIRE = 0
     SNEAKING = 1
     RIDING = 2
@@ -254,7 +340,11 @@ class EntityMetaDataFlag(Enum):
     DANCING = 48
 
 
-class WindowType(Enum):
+ENTITY_METADATA_FLAG_MASK = tuple(1 << flag.value for flag in EntityMetaDataFlag)
+ENTITY_METADATA_FLAG_CLEAR_MASK = tuple(~mask & 0xffffffffffffffff for mask in ENTITY_METADATA_FLAG_MASK)
+
+
+class WindowType(IntEnum):
     INVENTORY = 0
     OFFHAND = 119
     ARMOR = 120
@@ -264,7 +354,7 @@ class WindowType(Enum):
     CURSOR = 124
 
     
-class RecipeType(Enum):
+class RecipeType(IntEnum):
     SHAPELESS = 0
     SHAPED = 1
     FURNACE = 2
@@ -273,30 +363,28 @@ class RecipeType(Enum):
     SHULKER_BOX = 5
 
 
-class BlockType(Enum):
-    """Block IDs
-
-    See https://minecraft.gamepedia.com/Java_Edition_data_values/Block_IDs
-    """
+class BlockType(IntEnum, metaclass=_FastEnumMeta):
+    # Block IDs
+    # See https://minecraft.gamepedia.com/Java_Edition_data_values/Block_IDs
     # TODO check ID
     AIR = 0
     STONE = 1
     GRASS = 2
     DIRT = 3
     COBBLESTONE = 4
-    PLANKS = 5  # WOODEN_PLANKS
+    PLANKS = 5
     SAPLING = 6
     BEDROCK = 7
     FLOWING_WATER = 8
-    WATER = 9  # STILL_WATER
+    WATER = 9
     FLOWING_LAVA = 10
-    LAVA = 11  # STILL_LAVA
+    LAVA = 11
     SAND = 12
     GRAVEL = 13
     GOLD_ORE = 14
     IRON_ORE = 15
     COAL_ORE = 16
-    LOG = 17  # WOOD
+    LOG = 17
     LEAVES = 18
     SPONGE = 19
     GLASS = 20
@@ -304,19 +392,19 @@ class BlockType(Enum):
     LAPIS_BLOCK = 22
     DISPENSER = 23
     SANDSTONE = 24
-    NOTEBLOCK = 25  # NOTE_BLOCK
-    BED_BLOCK = 26  # BED
-    GOLDEN_RAIL = 27  # POWERED_RAIL
+    NOTEBLOCK = 25
+    BED_BLOCK = 26
+    GOLDEN_RAIL = 27
     DETECTOR_RAIL = 28
     STICKY_PISTON = 29
-    WEB = 30  # COBWEB
-    TALLGRASS = 31  # TALL_GRASS
+    WEB = 30
+    TALLGRASS = 31
     DEAD_BUSH = 32
     PISTON = 33
-    PISTON_HEAD = 34  # PISTONARMCOLLISION, PISTON_ARM_COLLISION
+    PISTON_HEAD = 34
     WOOL = 35
     PISTON_EXTENSION = 36
-    YELLOW_FLOWER = 37  # DANDELION
+    YELLOW_FLOWER = 37
     FLOWER = 38
     BROWN_MUSHROOM = 39
     RED_MUSHROOM = 40
@@ -327,42 +415,42 @@ class BlockType(Enum):
     BRICK_BLOCK = 45
     TNT = 46
     BOOKSHELF = 47
-    MOSSY_COBBLESTONE = 48  # MOSS_STONE
+    MOSSY_COBBLESTONE = 48
     OBSIDIAN = 49
     TORCH = 50
     FIRE = 51
-    MOB_SPAWNER = 52  # MONSTER_SPAWNER
-    OAK_STAIRS = 53   # WOODEN_STAIRS
+    MOB_SPAWNER = 52
+    OAK_STAIRS = 53
     CHEST = 54
     REDSTONE_WIRE = 55
     DIAMOND_ORE = 56
     DIAMOND_BLOCK = 57
-    CRAFTING_TABLE = 58  # WORKBENCH
-    WHEAT_BLOCK = 59  # WHEAT
+    CRAFTING_TABLE = 58
+    WHEAT_BLOCK = 59
     FARMLAND = 60
     FURNACE = 61
-    LIT_FURNACE = 62  # BURNING_FURNACE
-    STANDING_SIGN = 63  # SIGN_POST
-    WOODEN_DOOR_BLOCK = 64  # WOODEN_DOOR, OAK_DOOR_BLOCK
+    LIT_FURNACE = 62
+    STANDING_SIGN = 63
+    WOODEN_DOOR_BLOCK = 64
     LADDER = 65
     RAIL = 66
-    STONE_STAIRS = 67  # COBBLESTONE_STAIRS
+    STONE_STAIRS = 67
     WALL_SIGN = 68
     LEVER = 69
     STONE_PRESSURE_PLATE = 70
-    IRON_DOOR_BLOCK = 71  # IRON_DOOR
+    IRON_DOOR_BLOCK = 71
     WOODEN_PRESSURE_PLATE = 72
     REDSTONE_ORE = 73
-    LIT_REDSTONE_ORE = 74  # GLOWING_REDSTONE_ORE
+    LIT_REDSTONE_ORE = 74
     UNLIT_REDSTONE_TORCH = 75
-    REDSTONE_TORCH = 76  # LIT_REDSTONE_TORCH
+    REDSTONE_TORCH = 76
     STONE_BUTTON = 77
     SNOW_LAYER = 78
     ICE = 79
-    SNOW = 80  # SNOW_BLOCK
+    SNOW = 80
     CACTUS = 81
     CLAY = 82
-    REEDS_BLOCK = 83  # REEDS, SUGARCANE_BLOCK
+    REEDS_BLOCK = 83
     JUKEBOX = 84
     FENCE = 85
     PUMPKIN = 86
@@ -370,14 +458,14 @@ class BlockType(Enum):
     SOUL_SAND = 88
     GLOWSTONE = 89
     PORTAL = 90
-    LIT_PUMPKIN = 91  # JACK_O_LANTERN
+    LIT_PUMPKIN = 91
     CAKE_BLOCK = 92
-    UNPOWERED_REPEATER = 93  # REPEATER_BLOCK
+    UNPOWERED_REPEATER = 93
     POWERED_REPEATER = 94
     INVISIBLE_BEDROCK = 95
-    TRAPDOOR = 96  # WOODEN_TRAPDOOR
+    TRAPDOOR = 96
     MONSTER_EGG = 97
-    STONE_BRICK = 98  # STONE_BRICKS
+    STONE_BRICK = 98
     BROWN_MUSHROOM_BLOCK = 99
     RED_MUSHROOM_BLOCK = 100
     IRON_BARS = 101
@@ -385,8 +473,8 @@ class BlockType(Enum):
     MELON_BLOCK = 103
     PUMPKIN_STEM = 104
     MELON_STEM = 105
-    VINE = 106  # VINES
-    FENCE_GATE = 107  # OAK_FENCE_GATE
+    VINE = 106
+    FENCE_GATE = 107
     BRICK_STAIRS = 108
     STONE_BRICK_STAIRS = 109
     MYCELIUM = 110
@@ -395,9 +483,9 @@ class BlockType(Enum):
     NETHER_BRICK_FENCE = 113
     NETHER_BRICK_STAIRS = 114
     NETHER_WART_FULLY_GROWN = 115
-    ENCHANTING_TABLE = 116  # ENCHANTMENT_TABLE
-    BREWING_STAND_BLOCK = 117  # BREWING_STAND
-    CAULDRON_BLOCK = 118  # CAULDRON
+    ENCHANTING_TABLE = 116
+    BREWING_STAND_BLOCK = 117
+    CAULDRON_BLOCK = 118
     END_PORTAL = 119
     END_PORTAL_FRAME = 120
     END_STONE = 121
@@ -406,50 +494,50 @@ class BlockType(Enum):
     LIT_REDSTONE_LAMP = 124
     DROPPER = 125
     ACTIVATOR_RAIL = 126
-    COCOA = 127  # COCOA_BLOCK
+    COCOA = 127
     SANDSTONE_STAIRS = 128
     EMERALD_ORE = 129
     ENDER_CHEST = 130
     TRIPWIRE_HOOK = 131
-    TRIPWIRE = 132  # TRIP_WIRE
+    TRIPWIRE = 132
     EMERALD_BLOCK = 133
     SPRUCE_STAIRS = 134
     BIRCH_STAIRS = 135
     JUNGLE_STAIRS = 136
     COMMAND_BLOCK = 137
     BEACON = 138
-    COBBLESTONE_WALL = 139  # STONE_WALL
+    COBBLESTONE_WALL = 139
     FLOWER_POT_BLOCK = 140
-    CARROTS = 141  # CARROT_BLOCK
-    POTATOES = 142  # POTATO_BLOCK
+    CARROTS = 141
+    POTATOES = 142
     WOODEN_BUTTON = 143
-    SKULL_BLOCK = 144  # SKULL, MOB_HEAD_BLOCK
+    SKULL_BLOCK = 144
     ANVIL = 145
     TRAPPED_CHEST = 146
     LIGHT_WEIGHTED_PRESSURE_PLATE = 147
     HEAVY_WEIGHTED_PRESSURE_PLATE = 148
-    UNPOWERED_COMPARATOR = 149  # COMPARATOR_BLOCK
+    UNPOWERED_COMPARATOR = 149
     POWERED_COMPARATOR = 150
-    DAYLIGHT_DETECTOR = 151  # DAYLIGHT_SENSOR
+    DAYLIGHT_DETECTOR = 151
     REDSTONE_BLOCK = 152
-    QUARTZ_ORE = 153  # NETHER_QUARTZ_ORE
+    QUARTZ_ORE = 153
     HOPPER = 154
     QUARTZ_BLOCK = 155
     QUARTZ_STAIRS = 156
     DOUBLE_WOODEN_SLAB = 157
     WOODEN_SLAB = 158
-    STAINED_HARDENED_CLAY = 159  # STAINED_CLAY, TERRACOTTA
+    STAINED_HARDENED_CLAY = 159
     STAINED_GLASS_PANE = 160
     LEAVES2 = 161
-    LOG2 = 162  # WOOD2
+    LOG2 = 162
     ACACIA_STAIRS = 163
     DARK_OAK_STAIRS = 164
-    SLIME = 165  # SLIME_BLOCK
+    SLIME = 165
     BARRIER = 166
     IRON_TRAPDOOR = 167
     PRISMARINE = 168
-    SEA_LANTERN = 169  # SEALANTERN
-    HAY_BLOCK = 170  # HAY_BALE
+    SEA_LANTERN = 169
+    HAY_BLOCK = 170
     CARPET = 171
     HARDENED_CLAY = 172
     COAL_BLOCK = 173
@@ -457,7 +545,7 @@ class BlockType(Enum):
     DOUBLE_PLANT = 175
     STANDING_BANNER = 176
     WALL_BANNER = 177
-    DAYLIGHT_DETECTOR_INVERTED = 178  # DAYLIGHT_SENSOR_INVERTED
+    DAYLIGHT_DETECTOR_INVERTED = 178
     RED_SANDSTONE = 179
     RED_SANDSTONE_STAIRS = 180
     DOUBLE_STONE_SLAB2 = 181
@@ -478,7 +566,7 @@ class BlockType(Enum):
     ACACIA_DOOR_BLOCK = 196
     DARK_OAK_DOOR_BLOCK = 197
     GRASS_PATH = 198
-    FRAME_BLOCK = 199  # ITEM_FRAME_BLOCK
+    FRAME_BLOCK = 199
     CHORUS_FLOWER = 200
     PURPUR_BLOCK = 201
     PURPUR_PILLAR = 202
@@ -536,6 +624,110 @@ class BlockType(Enum):
     # STRUCTURE_BLOCK = 255
 
 
+_BLOCK_TYPE_LIST = [None] * 256
+for _block_type in BlockType:
+    _BLOCK_TYPE_LIST[_block_type.value] = _block_type
+
+
+def block_type_from_id(block_id: int) -> BlockType:
+    """
+    >>> block_type_from_id(1)
+    <BlockType.STONE: 1>
+    >>> block_type_from_id(239)
+    Traceback (most recent call last):
+      ...
+    ValueError: 239 is not a valid BlockType
+    """
+    if 0 <= block_id < len(_BLOCK_TYPE_LIST):
+        block_type = _BLOCK_TYPE_LIST[block_id]
+        if block_type is not None:
+            return block_type
+    return BlockType(block_id)  # raises ValueError for unknown IDs
+
+
+BLOCK_ID_TO_NAME = dict((block_type.value, block_type.name) for block_type in BlockType)
+
+
+def block_name(block_id: int) -> str:
+    """
+    >>> block_name(1)
+    'STONE'
+    >>> block_name(239)
+    'UNKNOWN'
+    """
+    return BLOCK_ID_TO_NAME.get(block_id, 'UNKNOWN')
+
+
+BLOCK_ALIASES = {
+    'WOODEN_PLANKS': BlockType.PLANKS,
+    'STILL_WATER': BlockType.WATER,
+    'STILL_LAVA': BlockType.LAVA,
+    'WOOD': BlockType.LOG,
+    'NOTE_BLOCK': BlockType.NOTEBLOCK,
+    'BED': BlockType.BED_BLOCK,
+    'POWERED_RAIL': BlockType.GOLDEN_RAIL,
+    'COBWEB': BlockType.WEB,
+    'TALL_GRASS': BlockType.TALLGRASS,
+    'PISTONARMCOLLISION': BlockType.PISTON_HEAD,
+    'PISTON_ARM_COLLISION': BlockType.PISTON_HEAD,
+    'DANDELION': BlockType.YELLOW_FLOWER,
+    'MOSS_STONE': BlockType.MOSSY_COBBLESTONE,
+    'MONSTER_SPAWNER': BlockType.MOB_SPAWNER,
+    'WOODEN_STAIRS': BlockType.OAK_STAIRS,
+    'WORKBENCH': BlockType.CRAFTING_TABLE,
+    'WHEAT': BlockType.WHEAT_BLOCK,
+    'BURNING_FURNACE': BlockType.LIT_FURNACE,
+    'SIGN_POST': BlockType.STANDING_SIGN,
+    'WOODEN_DOOR': BlockType.WOODEN_DOOR_BLOCK,
+    'OAK_DOOR_BLOCK': BlockType.WOODEN_DOOR_BLOCK,
+    'COBBLESTONE_STAIRS': BlockType.STONE_STAIRS,
+    'IRON_DOOR': BlockType.IRON_DOOR_BLOCK,
+    'GLOWING_REDSTONE_ORE': BlockType.LIT_REDSTONE_ORE,
+    'LIT_REDSTONE_TORCH': BlockType.REDSTONE_TORCH,
+    'SNOW_BLOCK': BlockType.SNOW,
+    'REEDS': BlockType.REEDS_BLOCK,
+    'SUGARCANE_BLOCK': BlockType.REEDS_BLOCK,
+    'JACK_O_LANTERN': BlockType.LIT_PUMPKIN,
+    'REPEATER_BLOCK': BlockType.UNPOWERED_REPEATER,
+    'WOODEN_TRAPDOOR': BlockType.TRAPDOOR,
+    'STONE_BRICKS': BlockType.STONE_BRICK,
+    'VINES': BlockType.VINE,
+    'OAK_FENCE_GATE': BlockType.FENCE_GATE,
+    'ENCHANTMENT_TABLE': BlockType.ENCHANTING_TABLE,
+    'BREWING_STAND': BlockType.BREWING_STAND_BLOCK,
+    'CAULDRON': BlockType.CAULDRON_BLOCK,
+    'COCOA_BLOCK': BlockType.COCOA,
+    'TRIP_WIRE': BlockType.TRIPWIRE,
+    'STONE_WALL': BlockType.COBBLESTONE_WALL,
+    'CARROT_BLOCK': BlockType.CARROTS,
+    'POTATO_BLOCK': BlockType.POTATOES,
+    'SKULL': BlockType.SKULL_BLOCK,
+    'MOB_HEAD_BLOCK': BlockType.SKULL_BLOCK,
+    'COMPARATOR_BLOCK': BlockType.UNPOWERED_COMPARATOR,
+    'DAYLIGHT_SENSOR': BlockType.DAYLIGHT_DETECTOR,
+    'NETHER_QUARTZ_ORE': BlockType.QUARTZ_ORE,
+    'STAINED_CLAY': BlockType.STAINED_HARDENED_CLAY,
+    'TERRACOTTA': BlockType.STAINED_HARDENED_CLAY,
+    'WOOD2': BlockType.LOG2,
+    'SLIME_BLOCK': BlockType.SLIME,
+    'SEALANTERN': BlockType.SEA_LANTERN,
+    'HAY_BALE': BlockType.HAY_BLOCK,
+    'DAYLIGHT_SENSOR_INVERTED': BlockType.DAYLIGHT_DETECTOR_INVERTED,
+    'ITEM_FRAME_BLOCK': BlockType.FRAME_BLOCK
+}
+
+
+def block_from_name(name: str) -> BlockType:
+    """
+    >>> block_from_name('PLANKS')
+    <BlockType.PLANKS: 5>
+    >>> block_from_name('WOODEN_PLANKS')
+    <BlockType.PLANKS: 5>
+    """
+    block_type = BLOCK_TYPE_BY_NAME.get(name)
+    return block_type if block_type is not None else BLOCK_ALIASES[name]
+
+
 class BlockFlag(Enum):
     NEIGHBORS = 0
     NETWORK = 1
@@ -543,11 +735,9 @@ class BlockFlag(Enum):
     PRIORITY = 3
 
     
-class BiomeType(Enum):
-    """Biome IDs
-
-    See https://minecraft.gamepedia.com/Java_Edition_data_values#Biome_IDs
-    """
+class BiomeType(IntEnum, metaclass=_FastEnumMeta):
+    # Biome IDs
+    # See https://minecraft.gamepedia.com/Java_Edition_data_values#Biome_IDs
     # TODO check ID
     OCEAN = 0
     PLAINS = 1
@@ -613,245 +803,271 @@ class BiomeType(Enum):
     MUTATED_MESA_CLEAR_ROCK = 167
 
 
-class _ItemType(Enum):
-    """Item IDs
+_DENSE_BIOME_TYPE_LIMIT = 40
+_DENSE_BIOME_TYPE_LIST = [BiomeType(i) for i in range(_DENSE_BIOME_TYPE_LIMIT)]
+_SPARSE_BIOME_TYPE_MAP = dict((b.value, b) for b in BiomeType if b.value >= _DENSE_BIOME_TYPE_LIMIT)
+
 
-    See https://minecraft.gamepedia.com/Java_Edition_data_values#Item_IDs
+def biome_type_from_id(biome_id: int) -> BiomeType:
     """
-    IRON_SHOVEL = 256
-    IRON_PICKAXE = 257
-    IRON_AXE = 258
-    FLINT_AND_STEEL = 259  # FLINT_STEEL
-    APPLE = 260
-    BOW = 261
-    ARROW = 262
-    COAL = 263
-    DIAMOND = 264
-    IRON_INGOT = 265
-    GOLD_INGOT = 266
-    IRON_SWORD = 267
-    WOODEN_SWORD = 268
-    WOODEN_SHOVEL = 269
-    WOODEN_PICKAXE = 270
-    WOODEN_AXE = 271
-    STONE_SWORD = 272
-    STONE_SHOVEL = 273
-    STONE_PICKAXE = 274
-    STONE_AXE = 275
-    DIAMOND_SWORD = 276
-    DIAMOND_SHOVEL = 277
-    DIAMOND_PICKAXE = 278
-    DIAMOND_AXE = 279
-    STICK = 280
-    BOWL = 281
-    MUSHROOM_STEW = 282
-    GOLDEN_SWORD = 283  # GOLD_SWORD
-    GOLDEN_SHOVEL = 284  # GOLD_SHOVEL
-    GOLDEN_PICKAXE = 285  # GOLD_PICKAXE
-    GOLDEN_AXE = 286  # GOLD_AXE
-    STRING = 287
-    FEATHER = 288
-    GUNPOWDER = 289
-    WOODEN_HOE = 290
-    STONE_HOE = 291
-    IRON_HOE = 292
-    DIAMOND_HOE = 293
-    GOLDEN_HOE = 294  # GOLD_HOE
-    WHEAT_SEEDS = 295  # SEEDS
-    WHEAT = 296
-    BREAD = 297
-    LEATHER_HELMET = 298  # LEATHER_CAP
-    LEATHER_CHESTPLATE = 299  # LEATHER_TUNIC
-    LEATHER_LEGGINGS = 300  # LEATHER_PANTS
-    LEATHER_BOOTS = 301
-    CHAINMAIL_HELMET = 302  # CHAIN_HELMET
-    CHAINMAIL_CHESTPLATE = 303  # CHAIN_CHESTPLATE
-    CHAINMAIL_LEGGINGS = 304  # CHAIN_LEGGINGS
-    CHAINMAIL_BOOTS = 305  # CHAIN_BOOTS
-    IRON_HELMET = 306
-    IRON_CHESTPLATE = 307
-    IRON_LEGGINGS = 308
-    IRON_BOOTS = 309
-    DIAMOND_HELMET = 310
-    DIAMOND_CHESTPLATE = 311
-    DIAMOND_LEGGINGS = 312
-    DIAMOND_BOOTS = 313
-    GOLDEN_HELMET = 314  # GOLD_HELMET
-    GOLDEN_CHESTPLATE = 315  # GOLD_CHESTPLATE
-    GOLDEN_LEGGINGS = 316  # GOLD_LEGGINGS
-    GOLDEN_BOOTS = 317  # GOLD_BOOTS
-    FLINT = 318
-    PORKCHOP = 319  # RAW_PORKCHOP
-    COOKED_PORKCHOP = 320
-    PAINTING = 321
-    GOLDEN_APPLE = 322
-    SIGN = 323
-    WOODEN_DOOR = 324  # OAK_DOOR
-    BUCKET = 325
-    WATER_BUCKET = 326
-    LAVE_BUCKET = 327
-    MINECART = 328
-    SADDLE = 329
-    IRON_DOOR = 330
-    REDSTONE = 331  # REDSTONE_DUST
-    SNOWBALL = 332
-    BOAT = 333
-    LEATHER = 334
-    MILK_BUCKET = 335
-    BRICK = 336
-    CLAY_BALL = 337  # CLAY
-    REEDS = 338  # SUGARCANE
-    PAPER = 339
-    BOOK = 340
-    SLIME_BALL = 341  # SLIMEBALL
-    CHEST_MINECART = 342  # MINECART_WITH_CHEST
-    FURNACE_MINECART = 343
-    EGG = 344
-    COMPASS = 345
-    FISHING_ROD = 346
-    CLOCK = 347
-    GLOWSTONE_DUST = 348
-    FISH = 349  # RAW_FISH
-    COOKED_FISH = 350
-    DYE = 351
-    BONE = 352
-    SUGAR = 353
-    CAKE = 354
-    BED = 355
-    REPEATER = 356
-    COOKIE = 357
-    FILLED_MAP = 358
-    SHEARS = 359
-    MELON = 360  # MELON_SLICE
-    PUMPKIN_SEEDS = 361
-    MELON_SEEDS = 362
-    BEEF = 363  # RAW_BEEF
-    COOKED_BEEF = 364  # STEAK
-    CHICKEN = 365  # RAW_CHICKEN
-    COOKED_CHICKEN = 366
-    ROTTEN_FLESH = 367
-    ENDER_PEARL = 368
-    BLAZE_ROD = 369
-    GHAST_TEAR = 370
-    GOLD_NUGGET = 371  # GOLDEN_NUGGET
-    NETHER_WART = 372
-    POTION = 373
-    GLASS_BOTTLE = 374
-    SPIDER_EYE = 375
-    FERMENTED_SPIDER_EYE = 376
-    BLAZE_POWDER = 377
-    MAGMA_CREAM = 378
-    BREWING_STAND = 379
-    CAULDRON = 380
-    ENDER_EYE = 381
-    SPECKLED_MELON = 382  # GLISTERING_MELON
-    SPAWN_EGG = 383
-    EXPERIENCE_BOTTLE = 384  # BOTTLE_O_ENCHANTING
-    FIRE_CHARGE = 385  # FIREBALL
-    WRITABLE_BOOK = 386
-    WRITTEN_BOOK = 387
-    EMERALD = 388
-    ITEM_FRAME = 389  # FRAME
-    FLOWER_POT = 390
-    CARROT = 391
-    POTATO = 392
-    BAKED_POTATO = 393
-    POISONOUS_POTATO = 394
-    MAP = 395  # EMPTYMAP, EMPTY_MAP
-    GOLDEN_CARROT = 396
-    SKULL = 397  # MOB_HEAD
-    CARROT_ON_A_STICK = 398  # CARROTONASTICK
-    NETHER_STAR = 399  # NETHERSTAR
-    PUMPKIN_PIE = 400
-    FIREWORKS = 401
-    FIREWORK_CHARGE = 402  # FIREWORKSCHARGE
-    ENCHANTED_BOOK = 403
-    COMPARATOR = 404
-    NETHER_BRICK = 405
-    QUARTZ = 406  # NETHER_QUARTZ
-    TNT_MINECART = 407  # MINECART_WITH_TNT
-    HOPPER_MINECART = 408  # MINECART_WITH_HOPPER
-    PRISMARINE_SHARD = 409
-    PRISMARINE_CRYSTALS = 410  # TODO check HOPPER?
-    RABBIT = 411  # RAW_RABBIT
-    COOKED_RABBIT = 412
-    RABBIT_STEW = 413
-    RABBIT_FOOT = 414
-    RABBIT_HIDE = 415
-    LEATHER_HORSE_ARMOR = 416
-    IRON_HORSE_ARMOR = 417  # HORSEARMORIRON, HORSE_ARMOR_IRON
-    GOLD_HORSE_ARMOR = 418  # HORSEARMORGOLD, HORSE_ARMOR_GOLD
-    DIAMOND_HORSE_ARMOR = 419  # HORSEARMORDIAMOND, HORSE_ARMOR_DIAMOND
-    LEAD = 420
-    NAME_TAG = 421  # NAMETAG
-    COMMAND_BLOCK_MINECART = 422  # TODO check PRISMARINE_CRYSTALS?
-    MUTTON = 423  # MUTTON_RAW, RAW_MUTTON
-    COOKED_MUTTON = 424  # MUTTONCOOKED, MUTTON_COOKED
-    ARMOR_STAND = 425
-    END_CRYSTAL = 426
-    SPRUCE_DOOR = 427
-    BIRCH_DOOR = 428
-    JUNGLE_DOOR = 429
-    ACACIA_DOOR = 430
-    DARK_OAK_DOOR = 431
-    CHORUS_FRUIT = 432
-    CHORUS_FRUIT_POPPED = 433
-    BEETROOT = 434
-    BEETROOT_SEEDS = 435
-    BEETROOT_SOUP = 436
-    DRAGON_BREATH = 437
-    SPLASH_POTION = 438
-    SPECTRAL_ARROW = 439
-    TIPPED_ARROW = 440
-    LINGERING_POTION = 441
-    SHIELD = 442
-    ELYTRA = 443  # TODO check COMMAND_BLOCK_MINECART, MINECART_WITH_COMMAND_BLOCK?
-    SPRUCE_BOAT = 444  # TODO check ELYTRA?
-    BIRCH_BOAT = 445  # TODO check SHULKER_SHELL?
-    BANNER = 446
-    ACACIA_BOAT = 447
-    DARK_OAK_BOAT = 448
-    TOTEM_OF_UNDYING = 449
-    SHULKER_SHELL = 450  # TODO check TOTEM?
+    >>> biome_type_from_id(1)
+    <BiomeType.PLAINS: 1>
+    >>> biome_type_from_id(127)
+    <BiomeType.THE_VOID: 127>
+    >>> biome_type_from_id(255)
+    Traceback (most recent call last):
+      ...
+    ValueError: 255 is not a valid BiomeType
+    """
+    if 0 <= biome_id < _DENSE_BIOME_TYPE_LIMIT:
+        return _DENSE_BIOME_TYPE_LIST[biome_id]
+    biome_type = _SPARSE_BIOME_TYPE_MAP.get(biome_id)
+    if biome_type is not None:
+        return biome_type
+    return BiomeType(biome_id)  # raises ValueError for unknown IDs
+
+
+_ITEM_TYPE_IDS = (  # (name, ID) pairs in order, since class namespaces are not ordered before Python 3.6
+    # Item IDs
+    # See https://minecraft.gamepedia.com/Java_Edition_data_values#Item_IDs
+    ('IRON_SHOVEL', 256),
+    ('IRON_PICKAXE', 257),
+    ('IRON_AXE', 258),
+    ('FLINT_AND_STEEL', 259),  # FLINT_STEEL
+    ('APPLE', 260),
+    ('BOW', 261),
+    ('ARROW', 262),
+    ('COAL', 263),
+    ('DIAMOND', 264),
+    ('IRON_INGOT', 265),
+    ('GOLD_INGOT', 266),
+    ('IRON_SWORD', 267),
+    ('WOODEN_SWORD', 268),
+    ('WOODEN_SHOVEL', 269),
+    ('WOODEN_PICKAXE', 270),
+    ('WOODEN_AXE', 271),
+    ('STONE_SWORD', 272),
+    ('STONE_SHOVEL', 273),
+    ('STONE_PICKAXE', 274),
+    ('STONE_AXE', 275),
+    ('DIAMOND_SWORD', 276),
+    ('DIAMOND_SHOVEL', 277),
+    ('DIAMOND_PICKAXE', 278),
+    ('DIAMOND_AXE', 279),
+    ('STICK', 280),
+    ('BOWL', 281),
+    ('MUSHROOM_STEW', 282),
+    ('GOLDEN_SWORD', 283),  # GOLD_SWORD
+    ('GOLDEN_SHOVEL', 284),  # GOLD_SHOVEL
+    ('GOLDEN_PICKAXE', 285),  # GOLD_PICKAXE
+    ('GOLDEN_AXE', 286),  # GOLD_AXE
+    ('STRING', 287),
+    ('FEATHER', 288),
+    ('GUNPOWDER', 289),
+    ('WOODEN_HOE', 290),
+    ('STONE_HOE', 291),
+    ('IRON_HOE', 292),
+    ('DIAMOND_HOE', 293),
+    ('GOLDEN_HOE', 294),  # GOLD_HOE
+    ('WHEAT_SEEDS', 295),  # SEEDS
+    ('WHEAT', 296),
+    ('BREAD', 297),
+    ('LEATHER_HELMET', 298),  # LEATHER_CAP
+    ('LEATHER_CHESTPLATE', 299),  # LEATHER_TUNIC
+    ('LEATHER_LEGGINGS', 300),  # LEATHER_PANTS
+    ('LEATHER_BOOTS', 301),
+    ('CHAINMAIL_HELMET', 302),  # CHAIN_HELMET
+    ('CHAINMAIL_CHESTPLATE', 303),  # CHAIN_CHESTPLATE
+    ('CHAINMAIL_LEGGINGS', 304),  # CHAIN_LEGGINGS
+    ('CHAINMAIL_BOOTS', 305),  # CHAIN_BOOTS
+    ('IRON_HELMET', 306),
+    ('IRON_CHESTPLATE', 307),
+    ('IRON_LEGGINGS', 308),
+    ('IRON_BOOTS', 309),
+    ('DIAMOND_HELMET', 310),
+    ('DIAMOND_CHESTPLATE', 311),
+    ('DIAMOND_LEGGINGS', 312),
+    ('DIAMOND_BOOTS', 313),
+    ('GOLDEN_HELMET', 314),  # GOLD_HELMET
+    ('GOLDEN_CHESTPLATE', 315),  # GOLD_CHESTPLATE
+    ('GOLDEN_LEGGINGS', 316),  # GOLD_LEGGINGS
+    ('GOLDEN_BOOTS', 317),  # GOLD_BOOTS
+    ('FLINT', 318),
+    ('PORKCHOP', 319),  # RAW_PORKCHOP
+    ('COOKED_PORKCHOP', 320),
+    ('PAINTING', 321),
+    ('GOLDEN_APPLE', 322),
+    ('SIGN', 323),
+    ('WOODEN_DOOR', 324),  # OAK_DOOR
+    ('BUCKET', 325),
+    ('WATER_BUCKET', 326),
+    ('LAVE_BUCKET', 327),
+    ('MINECART', 328),
+    ('SADDLE', 329),
+    ('IRON_DOOR', 330),
+    ('REDSTONE', 331),  # REDSTONE_DUST
+    ('SNOWBALL', 332),
+    ('BOAT', 333),
+    ('LEATHER', 334),
+    ('MILK_BUCKET', 335),
+    ('BRICK', 336),
+    ('CLAY_BALL', 337),  # CLAY
+    ('REEDS', 338),  # SUGARCANE
+    ('PAPER', 339),
+    ('BOOK', 340),
+    ('SLIME_BALL', 341),  # SLIMEBALL
+    ('CHEST_MINECART', 342),  # MINECART_WITH_CHEST
+    ('FURNACE_MINECART', 343),
+    ('EGG', 344),
+    ('COMPASS', 345),
+    ('FISHING_ROD', 346),
+    ('CLOCK', 347),
+    ('GLOWSTONE_DUST', 348),
+    ('FISH', 349),  # RAW_FISH
+    ('COOKED_FISH', 350),
+    ('DYE', 351),
+    ('BONE', 352),
+    ('SUGAR', 353),
+    ('CAKE', 354),
+    ('BED', 355),
+    ('REPEATER', 356),
+    ('COOKIE', 357),
+    ('FILLED_MAP', 358),
+    ('SHEARS', 359),
+    ('MELON', 360),  # MELON_SLICE
+    ('PUMPKIN_SEEDS', 361),
+    ('MELON_SEEDS', 362),
+    ('BEEF', 363),  # RAW_BEEF
+    ('COOKED_BEEF', 364),  # STEAK
+    ('CHICKEN', 365),  # RAW_CHICKEN
+    ('COOKED_CHICKEN', 366),
+    ('ROTTEN_FLESH', 367),
+    ('ENDER_PEARL', 368),
+    ('BLAZE_ROD', 369),
+    ('GHAST_TEAR', 370),
+    ('GOLD_NUGGET', 371),  # GOLDEN_NUGGET
+    ('NETHER_WART', 372),
+    ('POTION', 373),
+    ('GLASS_BOTTLE', 374),
+    ('SPIDER_EYE', 375),
+    ('FERMENTED_SPIDER_EYE', 376),
+    ('BLAZE_POWDER', 377),
+    ('MAGMA_CREAM', 378),
+    ('BREWING_STAND', 379),
+    ('CAULDRON', 380),
+    ('ENDER_EYE', 381),
+    ('SPECKLED_MELON', 382),  # GLISTERING_MELON
+    ('SPAWN_EGG', 383),
+    ('EXPERIENCE_BOTTLE', 384),  # BOTTLE_O_ENCHANTING
+    ('FIRE_CHARGE', 385),  # FIREBALL
+    ('WRITABLE_BOOK', 386),
+    ('WRITTEN_BOOK', 387),
+    ('EMERALD', 388),
+    ('ITEM_FRAME', 389),  # FRAME
+    ('FLOWER_POT', 390),
+    ('CARROT', 391),
+    ('POTATO', 392),
+    ('BAKED_POTATO', 393),
+    ('POISONOUS_POTATO', 394),
+    ('MAP', 395),  # EMPTYMAP, EMPTY_MAP
+    ('GOLDEN_CARROT', 396),
+    ('SKULL', 397),  # MOB_HEAD
+    ('CARROT_ON_A_STICK', 398),  # CARROTONASTICK
+    ('NETHER_STAR', 399),  # NETHERSTAR
+    ('PUMPKIN_PIE', 400),
+    ('FIREWORKS', 401),
+    ('FIREWORK_CHARGE', 402),  # FIREWORKSCHARGE
+    ('ENCHANTED_BOOK', 403),
+    ('COMPARATOR', 404),
+    ('NETHER_BRICK', 405),
+    ('QUARTZ', 406),  # NETHER_QUARTZ
+    ('TNT_MINECART', 407),  # MINECART_WITH_TNT
+    ('HOPPER_MINECART', 408),  # MINECART_WITH_HOPPER
+    ('PRISMARINE_SHARD', 409),
+    ('PRISMARINE_CRYSTALS', 410),  # TODO check HOPPER?
+    ('RABBIT', 411),  # RAW_RABBIT
+    ('COOKED_RABBIT', 412),
+    ('RABBIT_STEW', 413),
+    ('RABBIT_FOOT', 414),
+    ('RABBIT_HIDE', 415),
+    ('LEATHER_HORSE_ARMOR', 416),
+    ('IRON_HORSE_ARMOR', 417),  # HORSEARMORIRON, HORSE_ARMOR_IRON
+    ('GOLD_HORSE_ARMOR', 418),  # HORSEARMORGOLD, HORSE_ARMOR_GOLD
+    ('DIAMOND_HORSE_ARMOR', 419),  # HORSEARMORDIAMOND, HORSE_ARMOR_DIAMOND
+    ('LEAD', 420),
+    ('NAME_TAG', 421),  # NAMETAG
+    ('COMMAND_BLOCK_MINECART', 422),  # TODO check PRISMARINE_CRYSTALS?
+    ('MUTTON', 423),  # MUTTON_RAW, RAW_MUTTON
+    ('COOKED_MUTTON', 424),  # MUTTONCOOKED, MUTTON_COOKED
+    ('ARMOR_STAND', 425),
+    ('END_CRYSTAL', 426),
+    ('SPRUCE_DOOR', 427),
+    ('BIRCH_DOOR', 428),
+    ('JUNGLE_DOOR', 429),
+    ('ACACIA_DOOR', 430),
+    ('DARK_OAK_DOOR', 431),
+    ('CHORUS_FRUIT', 432),
+    ('CHORUS_FRUIT_POPPED', 433),
+    ('BEETROOT', 434),
+    ('BEETROOT_SEEDS', 435),
+    ('BEETROOT_SOUP', 436),
+    ('DRAGON_BREATH', 437),
+    ('SPLASH_POTION', 438),
+    ('SPECTRAL_ARROW', 439),
+    ('TIPPED_ARROW', 440),
+    ('LINGERING_POTION', 441),
+    ('SHIELD', 442),
+    ('ELYTRA', 443),  # TODO check COMMAND_BLOCK_MINECART, MINECART_WITH_COMMAND_BLOCK?
+    ('SPRUCE_BOAT', 444),  # TODO check ELYTRA?
+    ('BIRCH_BOAT', 445),  # TODO check SHULKER_SHELL?
+    ('BANNER', 446),
+    ('ACACIA_BOAT', 447),
+    ('DARK_OAK_BOAT', 448),
+    ('TOTEM_OF_UNDYING', 449),
+    ('SHULKER_SHELL', 450),  # TODO check TOTEM?
     # 451
-    IRON_NUGGET = 452
+    ('IRON_NUGGET', 452),
     # 453-463
-    UNKNOWN_457 = 457  # TODO check BEETROOT?
-    UNKNOWN_458 = 458  # TODO check BEETROOT_SEEDS?
-    UNKNOWN_459 = 459  # TODO check BEETROOT_SOUP?
+    ('UNKNOWN_457', 457),  # TODO check BEETROOT?
+    ('UNKNOWN_458', 458),  # TODO check BEETROOT_SEEDS?
+    ('UNKNOWN_459', 459),  # TODO check BEETROOT_SOUP?
     # RAW_SALMON = 460, SALMON = 460
     # CLOWNFISH = 461
     # PUFFERFISH = 462
-    UNKNOWN_463 = 463  # TODO check COOKED_SALMON?
-    UNKNOWN_466 = 466  # TODO check APPLEENCHANTED, APPLE_ENCHANTED, ENCHANTED_GOLDEN_APPLE?
+    ('UNKNOWN_463', 463),  # TODO check COOKED_SALMON?
+    ('UNKNOWN_466', 466),  # TODO check APPLEENCHANTED, APPLE_ENCHANTED, ENCHANTED_GOLDEN_APPLE?
 
     # TODO 2256-2267?
-    RECORD_13 = 500
-    RECORD_CAT = 501
-    RECORD_BLOCKS = 502
-    RECORD_CHIRP = 503
-    RECORD_FAR = 504
-    RECORD_MALL = 505
-    RECORD_MELLOHI = 506
-    RECORD_STAL = 507
-    RECORD_STRAD = 508
-    RECORD_WARD = 509
-    RECORD_11 = 510
-    RECORD_WAIT = 511
+    ('RECORD_13', 500),
+    ('RECORD_CAT', 501),
+    ('RECORD_BLOCKS', 502),
+    ('RECORD_CHIRP', 503),
+    ('RECORD_FAR', 504),
+    ('RECORD_MALL', 505),
+    ('RECORD_MELLOHI', 506),
+    ('RECORD_STAL', 507),
+    ('RECORD_STRAD', 508),
+    ('RECORD_WARD', 509),
+    ('RECORD_11', 510),
+    ('RECORD_WAIT', 511),
+)
 
 
 # noinspection PyArgumentList
-ItemType = Enum('ItemType', [(m.name, m.value) for m in chain(BlockType, _ItemType)])
+ItemType = Enum('ItemType', list(chain(
+    ((m.name, m.value) for m in BlockType),
+    _ITEM_TYPE_IDS
+)))
 
 
-class MoveMode(Enum):
+class MoveMode(IntEnum):
     NORMAL = 0
     RESET = 1
     TELEPORT = 2
     PITCH = 3
 
 
-class SoundType(Enum):
+class SoundType(IntEnum, metaclass=_FastEnumMeta):
     ITEM_USE_ON = 0
     HIT = 1
     STEP = 2
@@ -1020,7 +1236,7 @@ class SoundType(Enum):
     UNDEFINED = 167
 
 
-class PlayerActionType(Enum):
+class PlayerActionType(IntEnum, metaclass=_FastEnumMeta):
     START_BREAK = 0
     ABORT_BREAK = 1
     STOP_BREAK = 2
@@ -1046,76 +1262,76 @@ class PlayerActionType(Enum):
     UNKNOWN_36 = 36
 
 
-class TextType(Enum):
-    RAW = (0, False, False)
-    CHAT = (1, True, False)
-    TRANSLATION = (2, False, True)
-    POPUP = (3, False, True)
-    JUKEBOX_POPUP = (4, False, True)
-    TIP = (5, False, False)
-    SYSTEM = (6, False, False)
-    WHISPER = (7, True, False)
-    ANNOUNCEMENT = (8, True, False)
+class TextType(IntEnum):
+    RAW = 0
+    CHAT = 1
+    TRANSLATION = 2
+    POPUP = 3
+    JUKEBOX_POPUP = 4
+    TIP = 5
+    SYSTEM = 6
+    WHISPER = 7
+    ANNOUNCEMENT = 8
 
-    def __new__(cls, value: int, with_source: bool, with_parameters: bool) -> 'TextType':
+    @property
+    def with_source(self) -> bool:
         """
-        >>> TextType.CHAT
-        <TextType.CHAT: 1>
         >>> TextType.CHAT.with_source
         True
-        >>> TextType.CHAT.with_parameters
-        False
-        >>> TextType(1)
-        <TextType.CHAT: 1>
-        >>> TextType['CHAT']
-        <TextType.CHAT: 1>
         """
-        obj = object.__new__(cls)
-        obj._value_ = value
-        obj.with_source = with_source
-        obj.with_parameters = with_parameters
-        return obj
-
-
-class EscapeSequence(Enum):
-    BLACK = '0'
-    DARK_BLUE = '1'
-    DARK_GREEN = '2'
-    DARK_AQUA = '3'
-    DARK_RED = '4'
-    DARK_PURPLE = '5'
-    GOLD = '6'
-    GRAY = '7'
-    DARK_GRAY = '8'
-    BLUE = '9'
-    GREEN = 'a'
-    AQUA = 'b'
-    RED = 'c'
-    LIGHT_PURPLE = 'd'
-    YELLOW = 'e'
-    WHITE = 'f'
-    OBFUSCATED = 'k'
-    BOLD = 'l'
-    STRIKE_THROUGH = 'm'
-    UNDERLINE = 'n'
-    ITALIC = 'o'
-    RESET = 'r'
-
-    def __new__(cls, value: str) -> 'EscapeSequence':
+        return TEXT_TYPE_WITH_SOURCE[self]
+
+    @property
+    def with_parameters(self) -> bool:
         """
-        >>> EscapeSequence.BLACK
-        <EscapeSequence.BLACK: '§0'>
-        >>> EscapeSequence('§0')
-        <EscapeSequence.BLACK: '§0'>
-        >>> EscapeSequence['BLACK']
-        <EscapeSequence.BLACK: '§0'>
+        >>> TextType.CHAT.with_parameters
+        False
         """
-        obj = object.__new__(cls)
-        obj._value_ = b'\xc2\xa7'.decode() + value  # '§[value]'
-        return obj
+        return TEXT_TYPE_WITH_PARAMETERS[self]
+
+
+# indexed by TextType value
+TEXT_TYPE_WITH_SOURCE = (False, True, False, False, False, False, False, True, True)
+TEXT_TYPE_WITH_PARAMETERS = (False, False, True, True, True, False, False, False, False)
+
 
+class EscapeSequence:
+    """Formatting codes for chat text.
 
-class EntityEventType(Enum):
+    >>> EscapeSequence.BLACK
+    '§0'
+    >>> ESCAPE_BY_NAME['BLACK']
+    '§0'
+    """
+
+    BLACK = '§0'
+    DARK_BLUE = '§1'
+    DARK_GREEN = '§2'
+    DARK_AQUA = '§3'
+    DARK_RED = '§4'
+    DARK_PURPLE = '§5'
+    GOLD = '§6'
+    GRAY = '§7'
+    DARK_GRAY = '§8'
+    BLUE = '§9'
+    GREEN = '§a'
+    AQUA = '§b'
+    RED = '§c'
+    LIGHT_PURPLE = '§d'
+    YELLOW = '§e'
+    WHITE = '§f'
+    OBFUSCATED = '§k'
+    BOLD = '§l'
+    STRIKE_THROUGH = '§m'
+    UNDERLINE = '§n'
+    ITALIC = '§o'
+    RESET = '§r'
+
+
+ESCAPE_BY_NAME = dict((name, value) for name, value in vars(EscapeSequence).items() if not name.startswith('_'))
+
+
+class EntityEventType(IntEnum):
     HURT_ANIMATION = 2
     DEATH_ANIMATION = 3
     ARM_SWING = 4
@@ -1166,14 +1382,14 @@ class EntityEventType(Enum):
     ITEM_ENTITY_MERGE = 69
 
 
-class SourceType(Enum):
+class SourceType(IntEnum):
     CONTAINER = 0
     WORLD = 2
     CREATIVE = 3
     TODO = 99999
 
 
-class EntityType(Enum):
+class EntityType(IntEnum, metaclass=_FastEnumMeta):
     CHICKEN = 10
     COW = 11
     PIG = 12
@@ -1344,6 +1560,17 @@ class SpaceEventType(Enum):
     PLAYERS_SLEEPING = 9800
 
 
+BLOCK_TYPE_BY_ID = BlockType._value2member_map_
+BLOCK_TYPE_BY_NAME = BlockType.__members__
+BIOME_TYPE_BY_ID = BiomeType._value2member_map_
+SOUND_TYPE_BY_ID = SoundType._value2member_map_
+ENTITY_TYPE_BY_ID = EntityType._value2member_map_
+ENTITY_META_KEY_BY_ID = EntityMetaDataKey._value2member_map_
+PLAYER_ACTION_TYPE_BY_ID = PlayerActionType._value2member_map_
+
+# To compare with a plain int in hot loops, use const_int module, e.g. const_int.PlayerActionType_JUMP
+
+
 if __name__ == '__main__':
     import doctest
     doctest_result = doctest.testmod()
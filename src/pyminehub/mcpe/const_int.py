@@ -0,0 +1,836 @@
+"""Integer mirror of IntEnum members in pyminehub.mcpe.const
+
+Generated by tool.constint module. Do not edit by hand.
+"""
+
+
+Dimension_OVERWORLD = 0
+Dimension_NETHER = 1
+Dimension_THE_END = 2
+
+GeneratorType_OLD = 0
+GeneratorType_INFINITE = 1
+GeneratorType_FLAT = 2
+
+GameMode_SURVIVAL = 0
+GameMode_CREATIVE = 1
+GameMode_ADVENTURE = 2
+
+Difficulty_PEACEFUL = 0
+Difficulty_EASY = 1
+Difficulty_NORMAL = 2
+Difficulty_HARD = 3
+
+GameRuleType_BOOL = 1
+GameRuleType_INT = 2
+GameRuleType_FLOAT = 3
+
+PlayerPermission_CUSTOM = 3
+PlayerPermission_OPERATOR = 2
+PlayerPermission_MEMBER = 1
+PlayerPermission_VISITOR = 0
+
+AdventureSettingFlag1_WORLD_IMMUTABLE = 0
+AdventureSettingFlag1_NO_PVP = 1
+AdventureSettingFlag1_AUTO_JUMP = 5
+AdventureSettingFlag1_ALLOW_FLIGHT = 6
+AdventureSettingFlag1_NO_CLIP = 7
+AdventureSettingFlag1_WORLD_BUILDER = 8
+AdventureSettingFlag1_FLYING = 9
+AdventureSettingFlag1_MUTED = 10
+
+AdventureSettingFlag2_BUILD_AND_MINE = 0
+AdventureSettingFlag2_DOORS_AND_SWITCHES = 1
+AdventureSettingFlag2_OPEN_CONTAINERS = 2
+AdventureSettingFlag2_ATTACK_PLAYERS = 3
+AdventureSettingFlag2_ATTACK_MOBS = 4
+AdventureSettingFlag2_OPERATOR = 5
+AdventureSettingFlag2_TELEPORT = 7
+
+MetaDataType_BYTE = 0
+MetaDataType_SHORT = 1
+MetaDataType_INT = 2
+MetaDataType_FLOAT = 3
+MetaDataType_STRING = 4
+MetaDataType_ITEM = 5
+MetaDataType_INT_VECTOR3 = 6
+MetaDataType_LONG = 7
+MetaDataType_FLOAT_VECTOR3 = 8
+
+EntityMetaDataKey_FLAGS = 0
+EntityMetaDataKey_HEALTH = 1
+EntityMetaDataKey_VARIANT = 2
+EntityMetaDataKey_COLOR = 3
+EntityMetaDataKey_NAMETAG = 4
+EntityMetaDataKey_OWNER_EID = 5
+EntityMetaDataKey_TARGET_EID = 6
+EntityMetaDataKey_AIR = 7
+EntityMetaDataKey_POTION_COLOR = 8
+EntityMetaDataKey_POTION_AMBIENT = 9
+EntityMetaDataKey_HURT_TIME = 11
+EntityMetaDataKey_HURT_DIRECTION = 12
+EntityMetaDataKey_PADDLE_TIME_LEFT = 13
+EntityMetaDataKey_PADDLE_TIME_RIGHT = 14
+EntityMetaDataKey_EXPERIENCE_VALUE = 15
+EntityMetaDataKey_MINECART_DISPLAY_BLOCK = 16
+EntityMetaDataKey_MINECART_DISPLAY_OFFSET = 17
+EntityMetaDataKey_MINECART_HAS_DISPLAY = 18
+EntityMetaDataKey_ENDERMAN_HELD_ITEM_ID = 23
+EntityMetaDataKey_ENDERMAN_HELD_ITEM_DAMAGE = 24
+EntityMetaDataKey_ENTITY_AGE = 25
+EntityMetaDataKey_BED_POSITION = 29
+EntityMetaDataKey_FIREBALL_POWER_X = 30
+EntityMetaDataKey_FIREBALL_POWER_Y = 31
+EntityMetaDataKey_FIREBALL_POWER_Z = 32
+EntityMetaDataKey_POTION_AUX_VALUE = 37
+EntityMetaDataKey_LEAD_HOLDER_EID = 38
+EntityMetaDataKey_SCALE = 39
+EntityMetaDataKey_INTERACTIVE_TAG = 40
+EntityMetaDataKey_NPC_SKIN_ID = 41
+EntityMetaDataKey_URL_TAG = 42
+EntityMetaDataKey_MAX_AIR = 43
+EntityMetaDataKey_MARK_VARIANT = 44
+EntityMetaDataKey_BLOCK_TARGET = 48
+EntityMetaDataKey_WITHER_INVULNERABLE_TICKS = 49
+EntityMetaDataKey_WITHER_TARGET_1 = 50
+EntityMetaDataKey_WITHER_TARGET_2 = 51
+EntityMetaDataKey_WITHER_TARGET_3 = 52
+EntityMetaDataKey_BOUNDING_BOX_WIDTH = 54
+EntityMetaDataKey_BOUNDING_BOX_HEIGHT = 55
+EntityMetaDataKey_FUSE_LENGTH = 56
+EntityMetaDataKey_RIDER_SEAT_POSITION = 57
+EntityMetaDataKey_RIDER_ROTATION_LOCKED = 58
+EntityMetaDataKey_RIDER_MAX_ROTATION = 59
+EntityMetaDataKey_RIDER_MIN_ROTATION = 60
+EntityMetaDataKey_AREA_EFFECT_CLOUD_RADIUS = 61
+EntityMetaDataKey_AREA_EFFECT_CLOUD_WAITING = 62
+EntityMetaDataKey_AREA_EFFECT_CLOUD_PARTICLE_ID = 63
+EntityMetaDataKey_SHULKER_ATTACH_FACE = 65
+EntityMetaDataKey_SHULKER_ATTACH_POS = 67
+EntityMetaDataKey_TRADING_PLAYER_EID = 68
+EntityMetaDataKey_COMMAND_BLOCK_COMMAND = 71
+EntityMetaDataKey_COMMAND_BLOCK_LAST_OUTPUT = 72
+EntityMetaDataKey_COMMAND_BLOCK_TRACK_OUTPUT = 73
+EntityMetaDataKey_CONTROLLING_RIDER_SEAT_NUMBER = 74
+EntityMetaDataKey_STRENGTH = 75
+EntityMetaDataKey_MAX_STRENGTH = 76
+
+EntityMetaDataFlag_ONFIRE = 0
+EntityMetaDataFlag_SNEAKING = 1
+EntityMetaDataFlag_RIDING = 2
+EntityMetaDataFlag_SPRINTING = 3
+EntityMetaDataFlag_ACTION = 4
+EntityMetaDataFlag_INVISIBLE = 5
+EntityMetaDataFlag_TEMPTED = 6
+EntityMetaDataFlag_INLOVE = 7
+EntityMetaDataFlag_SADDLED = 8
+EntityMetaDataFlag_POWERED = 9
+EntityMetaDataFlag_IGNITED = 10
+EntityMetaDataFlag_BABY = 11
+EntityMetaDataFlag_CONVERTING = 12
+EntityMetaDataFlag_CRITICAL = 13
+EntityMetaDataFlag_CAN_SHOW_NAMETAG = 14
+EntityMetaDataFlag_ALWAYS_SHOW_NAMETAG = 15
+EntityMetaDataFlag_IMMOBILE = 16
+EntityMetaDataFlag_SILENT = 17
+EntityMetaDataFlag_WALLCLIMBING = 18
+EntityMetaDataFlag_CAN_CLIMB = 19
+EntityMetaDataFlag_SWIMMER = 20
+EntityMetaDataFlag_CAN_FLY = 21
+EntityMetaDataFlag_RESTING = 22
+EntityMetaDataFlag_SITTING = 23
+EntityMetaDataFlag_ANGRY = 24
+EntityMetaDataFlag_INTERESTED = 25
+EntityMetaDataFlag_CHARGED = 26
+EntityMetaDataFlag_TAMED = 27
+EntityMetaDataFlag_LEASHED = 28
+EntityMetaDataFlag_SHEARED = 29
+EntityMetaDataFlag_GLIDING = 30
+EntityMetaDataFlag_ELDER = 31
+EntityMetaDataFlag_MOVING = 32
+EntityMetaDataFlag_BREATHING = 33
+EntityMetaDataFlag_CHESTED = 34
+EntityMetaDataFlag_STACKABLE = 35
+EntityMetaDataFlag_SHOWBASE = 36
+EntityMetaDataFlag_REARING = 37
+EntityMetaDataFlag_VIBRATING = 38
+EntityMetaDataFlag_IDLING = 39
+EntityMetaDataFlag_EVOKER_SPELL = 40
+EntityMetaDataFlag_CHARGE_ATTACK = 41
+EntityMetaDataFlag_WASD_CONTROLLED = 42
+EntityMetaDataFlag_CAN_POWER_JUMP = 43
+EntityMetaDataFlag_LINGER = 44
+EntityMetaDataFlag_HAS_COLLISION = 45
+EntityMetaDataFlag_AFFECTED_BY_GRAVITY = 46
+EntityMetaDataFlag_FIRE_IMMUNE = 47
+EntityMetaDataFlag_DANCING = 48
+
+WindowType_INVENTORY = 0
+WindowType_OFFHAND = 119
+WindowType_ARMOR = 120
+WindowType_CREATIVE = 121
+WindowType_HOTBAR = 122
+WindowType_FIXED_INVENTORY = 123
+WindowType_CURSOR = 124
+
+RecipeType_SHAPELESS = 0
+RecipeType_SHAPED = 1
+RecipeType_FURNACE = 2
+RecipeType_FURNACE_DATA = 3
+RecipeType_MULTI = 4
+RecipeType_SHULKER_BOX = 5
+
+BlockType_AIR = 0
+BlockType_STONE = 1
+BlockType_GRASS = 2
+BlockType_DIRT = 3
+BlockType_COBBLESTONE = 4
+BlockType_PLANKS = 5
+BlockType_SAPLING = 6
+BlockType_BEDROCK = 7
+BlockType_FLOWING_WATER = 8
+BlockType_WATER = 9
+BlockType_FLOWING_LAVA = 10
+BlockType_LAVA = 11
+BlockType_SAND = 12
+BlockType_GRAVEL = 13
+BlockType_GOLD_ORE = 14
+BlockType_IRON_ORE = 15
+BlockType_COAL_ORE = 16
+BlockType_LOG = 17
+BlockType_LEAVES = 18
+BlockType_SPONGE = 19
+BlockType_GLASS = 20
+BlockType_LAPIS_ORE = 21
+BlockType_LAPIS_BLOCK = 22
+BlockType_DISPENSER = 23
+BlockType_SANDSTONE = 24
+BlockType_NOTEBLOCK = 25
+BlockType_BED_BLOCK = 26
+BlockType_GOLDEN_RAIL = 27
+BlockType_DETECTOR_RAIL = 28
+BlockType_STICKY_PISTON = 29
+BlockType_WEB = 30
+BlockType_TALLGRASS = 31
+BlockType_DEAD_BUSH = 32
+BlockType_PISTON = 33
+BlockType_PISTON_HEAD = 34
+BlockType_WOOL = 35
+BlockType_PISTON_EXTENSION = 36
+BlockType_YELLOW_FLOWER = 37
+BlockType_FLOWER = 38
+BlockType_BROWN_MUSHROOM = 39
+BlockType_RED_MUSHROOM = 40
+BlockType_GOLD_BLOCK = 41
+BlockType_IRON_BLOCK = 42
+BlockType_DOUBLE_STONE_SLAB = 43
+BlockType_STONE_SLAB = 44
+BlockType_BRICK_BLOCK = 45
+BlockType_TNT = 46
+BlockType_BOOKSHELF = 47
+BlockType_MOSSY_COBBLESTONE = 48
+BlockType_OBSIDIAN = 49
+BlockType_TORCH = 50
+BlockType_FIRE = 51
+BlockType_MOB_SPAWNER = 52
+BlockType_OAK_STAIRS = 53
+BlockType_CHEST = 54
+BlockType_REDSTONE_WIRE = 55
+BlockType_DIAMOND_ORE = 56
+BlockType_DIAMOND_BLOCK = 57
+BlockType_CRAFTING_TABLE = 58
+BlockType_WHEAT_BLOCK = 59
+BlockType_FARMLAND = 60
+BlockType_FURNACE = 61
+BlockType_LIT_FURNACE = 62
+BlockType_STANDING_SIGN = 63
+BlockType_WOODEN_DOOR_BLOCK = 64
+BlockType_LADDER = 65
+BlockType_RAIL = 66
+BlockType_STONE_STAIRS = 67
+BlockType_WALL_SIGN = 68
+BlockType_LEVER = 69
+BlockType_STONE_PRESSURE_PLATE = 70
+BlockType_IRON_DOOR_BLOCK = 71
+BlockType_WOODEN_PRESSURE_PLATE = 72
+BlockType_REDSTONE_ORE = 73
+BlockType_LIT_REDSTONE_ORE = 74
+BlockType_UNLIT_REDSTONE_TORCH = 75
+BlockType_REDSTONE_TORCH = 76
+BlockType_STONE_BUTTON = 77
+BlockType_SNOW_LAYER = 78
+BlockType_ICE = 79
+BlockType_SNOW = 80
+BlockType_CACTUS = 81
+BlockType_CLAY = 82
+BlockType_REEDS_BLOCK = 83
+BlockType_JUKEBOX = 84
+BlockType_FENCE = 85
+BlockType_PUMPKIN = 86
+BlockType_NETHERRACK = 87
+BlockType_SOUL_SAND = 88
+BlockType_GLOWSTONE = 89
+BlockType_PORTAL = 90
+BlockType_LIT_PUMPKIN = 91
+BlockType_CAKE_BLOCK = 92
+BlockType_UNPOWERED_REPEATER = 93
+BlockType_POWERED_REPEATER = 94
+BlockType_INVISIBLE_BEDROCK = 95
+BlockType_TRAPDOOR = 96
+BlockType_MONSTER_EGG = 97
+BlockType_STONE_BRICK = 98
+BlockType_BROWN_MUSHROOM_BLOCK = 99
+BlockType_RED_MUSHROOM_BLOCK = 100
+BlockType_IRON_BARS = 101
+BlockType_GLASS_PANE = 102
+BlockType_MELON_BLOCK = 103
+BlockType_PUMPKIN_STEM = 104
+BlockType_MELON_STEM = 105
+BlockType_VINE = 106
+BlockType_FENCE_GATE = 107
+BlockType_BRICK_STAIRS = 108
+BlockType_STONE_BRICK_STAIRS = 109
+BlockType_MYCELIUM = 110
+BlockType_LILY_PAD = 111
+BlockType_NETHER_BRICK_BLOCK = 112
+BlockType_NETHER_BRICK_FENCE = 113
+BlockType_NETHER_BRICK_STAIRS = 114
+BlockType_NETHER_WART_FULLY_GROWN = 115
+BlockType_ENCHANTING_TABLE = 116
+BlockType_BREWING_STAND_BLOCK = 117
+BlockType_CAULDRON_BLOCK = 118
+BlockType_END_PORTAL = 119
+BlockType_END_PORTAL_FRAME = 120
+BlockType_END_STONE = 121
+BlockType_DRAGON_EGG = 122
+BlockType_REDSTONE_LAMP = 123
+BlockType_LIT_REDSTONE_LAMP = 124
+BlockType_DROPPER = 125
+BlockType_ACTIVATOR_RAIL = 126
+BlockType_COCOA = 127
+BlockType_SANDSTONE_STAIRS = 128
+BlockType_EMERALD_ORE = 129
+BlockType_ENDER_CHEST = 130
+BlockType_TRIPWIRE_HOOK = 131
+BlockType_TRIPWIRE = 132
+BlockType_EMERALD_BLOCK = 133
+BlockType_SPRUCE_STAIRS = 134
+BlockType_BIRCH_STAIRS = 135
+BlockType_JUNGLE_STAIRS = 136
+BlockType_COMMAND_BLOCK = 137
+BlockType_BEACON = 138
+BlockType_COBBLESTONE_WALL = 139
+BlockType_FLOWER_POT_BLOCK = 140
+BlockType_CARROTS = 141
+BlockType_POTATOES = 142
+BlockType_WOODEN_BUTTON = 143
+BlockType_SKULL_BLOCK = 144
+BlockType_ANVIL = 145
+BlockType_TRAPPED_CHEST = 146
+BlockType_LIGHT_WEIGHTED_PRESSURE_PLATE = 147
+BlockType_HEAVY_WEIGHTED_PRESSURE_PLATE = 148
+BlockType_UNPOWERED_COMPARATOR = 149
+BlockType_POWERED_COMPARATOR = 150
+BlockType_DAYLIGHT_DETECTOR = 151
+BlockType_REDSTONE_BLOCK = 152
+BlockType_QUARTZ_ORE = 153
+BlockType_HOPPER = 154
+BlockType_QUARTZ_BLOCK = 155
+BlockType_QUARTZ_STAIRS = 156
+BlockType_DOUBLE_WOODEN_SLAB = 157
+BlockType_WOODEN_SLAB = 158
+BlockType_STAINED_HARDENED_CLAY = 159
+BlockType_STAINED_GLASS_PANE = 160
+BlockType_LEAVES2 = 161
+BlockType_LOG2 = 162
+BlockType_ACACIA_STAIRS = 163
+BlockType_DARK_OAK_STAIRS = 164
+BlockType_SLIME = 165
+BlockType_BARRIER = 166
+BlockType_IRON_TRAPDOOR = 167
+BlockType_PRISMARINE = 168
+BlockType_SEA_LANTERN = 169
+BlockType_HAY_BLOCK = 170
+BlockType_CARPET = 171
+BlockType_HARDENED_CLAY = 172
+BlockType_COAL_BLOCK = 173
+BlockType_PACKED_ICE = 174
+BlockType_DOUBLE_PLANT = 175
+BlockType_STANDING_BANNER = 176
+BlockType_WALL_BANNER = 177
+BlockType_DAYLIGHT_DETECTOR_INVERTED = 178
+BlockType_RED_SANDSTONE = 179
+BlockType_RED_SANDSTONE_STAIRS = 180
+BlockType_DOUBLE_STONE_SLAB2 = 181
+BlockType_STONE_SLAB2 = 182
+BlockType_SPRUCE_FENCE_GATE = 183
+BlockType_BIRCH_FENCE_GATE = 184
+BlockType_JUNGLE_FENCE_GATE = 185
+BlockType_DARK_OAK_FENCE_GATE = 186
+BlockType_ACACIA_FENCE_GATE = 187
+BlockType_SPRUCE_FENCE = 188
+BlockType_BRICK_FENCE = 189
+BlockType_JUNGLE_FENCE = 190
+BlockType_DARK_OAK_FENCE = 191
+BlockType_ACACIA_FENCE = 192
+BlockType_SPRUCE_DOOR_BLOCK = 193
+BlockType_BIRCH_DOOR_BLOCK = 194
+BlockType_JUNGLE_DOOR_BLOCK = 195
+BlockType_ACACIA_DOOR_BLOCK = 196
+BlockType_DARK_OAK_DOOR_BLOCK = 197
+BlockType_GRASS_PATH = 198
+BlockType_FRAME_BLOCK = 199
+BlockType_CHORUS_FLOWER = 200
+BlockType_PURPUR_BLOCK = 201
+BlockType_PURPUR_PILLAR = 202
+BlockType_PURPUR_STAIRS = 203
+BlockType_PURPUR_DOUBLE_SLAB = 204
+BlockType_PURPUR_SLAB = 205
+BlockType_END_BRICK = 206
+BlockType_BEETROOTS = 207
+BlockType_END_ROD = 208
+BlockType_END_GATEWAY = 209
+BlockType_REPEATING_COMMAND_BLOCK = 210
+BlockType_CHAIN_COMMAND_BLOCK = 211
+BlockType_FROSTED_ICE = 212
+BlockType_MAGMA = 213
+BlockType_NETHER_WART_BLOCK = 214
+BlockType_RED_NETHER_BRICK = 215
+BlockType_BONE_BLOCK = 216
+BlockType_STRUCTURE_VOID = 217
+BlockType_SHULKER_BOX = 218
+BlockType_PURPLE_GLAZED_TERRACOTTA = 219
+BlockType_WHITE_GLAZED_TERRACOTTA = 220
+BlockType_ORANGE_GLAZED_TERRACOTTA = 221
+BlockType_MAGENTA_GLAZED_TERRACOTTA = 222
+BlockType_LIGHT_BLUE_GLAZED_TERRACOTTA = 223
+BlockType_YELLOW_GLAZED_TERRACOTTA = 224
+BlockType_LIME_GLAZED_TERRACOTTA = 225
+BlockType_PINK_GLAZED_TERRACOTTA = 226
+BlockType_GRAY_GLAZED_TERRACOTTA = 227
+BlockType_SILVER_GLAZED_TERRACOTTA = 228
+BlockType_CYAN_GLAZED_TERRACOTTA = 229
+BlockType_BLUE_SHULKER_BOX = 230
+BlockType_BLUE_GLAZED_TERRACOTTA = 231
+BlockType_BROWN_GLAZED_TERRACOTTA = 232
+BlockType_GREEN_GLAZED_TERRACOTTA = 233
+BlockType_RED_GLAZED_TERRACOTTA = 234
+BlockType_BLACK_GLAZED_TERRACOTTA = 235
+BlockType_CONCRETE = 236
+BlockType_CONCRETE_POWDER = 237
+BlockType_CHORUS_PLANT = 240
+BlockType_STAINED_GLASS = 241
+BlockType_PODZOL = 243
+BlockType_BEETROOT_BLOCK = 244
+BlockType_STONECUTTER = 245
+BlockType_GLOWING_OBSIDIAN = 246
+BlockType_NETHER_REACTOR = 247
+BlockType_INFO_UPDATE = 248
+BlockType_INFO_UPDATE2 = 249
+BlockType_MOVING_BLOCK = 250
+BlockType_OBSERVER = 251
+BlockType_STRUCTURE_BLOCK = 252
+BlockType_UNUSED_FD = 253
+BlockType_UNUSED_FE = 254
+
+BiomeType_OCEAN = 0
+BiomeType_PLAINS = 1
+BiomeType_DESERT = 2
+BiomeType_EXTREME_HILLS = 3
+BiomeType_FOREST = 4
+BiomeType_TAIGA = 5
+BiomeType_SWAMPLAND = 6
+BiomeType_RIVER = 7
+BiomeType_HELL = 8
+BiomeType_THE_END = 9
+BiomeType_FROZEN_OCEAN = 10
+BiomeType_FROZEN_RIVER = 11
+BiomeType_ICE_PLAINS = 12
+BiomeType_ICE_MOUNTAINS = 13
+BiomeType_MUSHROOM_ISLAND = 14
+BiomeType_MUSHROOM_ISLAND_SHORE = 15
+BiomeType_BEACH = 16
+BiomeType_DESERT_HILLS = 17
+BiomeType_FOREST_HILLS = 18
+BiomeType_TAIGA_HILLS = 19
+BiomeType_SMALLER_EXTREME_HILLS = 20
+BiomeType_JUNGLE = 21
+BiomeType_JUNGLE_HILLS = 22
+BiomeType_JUNGLE_EDGE = 23
+BiomeType_DEEP_OCEAN = 24
+BiomeType_STONE_BEACH = 25
+BiomeType_COLD_BEACH = 26
+BiomeType_BIRCH_FOREST = 27
+BiomeType_BIRCH_FOREST_HILLS = 28
+BiomeType_ROOFED_FOREST = 29
+BiomeType_TAIGA_COLD = 30
+BiomeType_TAIGA_COLD_HILLS = 31
+BiomeType_REDWOOD_TAIGA = 32
+BiomeType_REDWOOD_TAIGA_HILLS = 33
+BiomeType_EXTREME_HILLS_WITH_TREES = 34
+BiomeType_SAVANNA = 35
+BiomeType_SAVANNA_ROCK = 36
+BiomeType_MESA = 37
+BiomeType_MESA_ROCK = 38
+BiomeType_MESA_CLEAR_ROCK = 39
+BiomeType_THE_VOID = 127
+BiomeType_MUTATED_PLAINS = 129
+BiomeType_MUTATED_DESERT = 130
+BiomeType_MUTATED_EXTREME_HILLS = 131
+BiomeType_MUTATED_FOREST = 132
+BiomeType_MUTATED_TAIGA = 133
+BiomeType_MUTATED_SWAMPLAND = 134
+BiomeType_MUTATED_ICE_FLATS = 140
+BiomeType_MUTATED_JUNGLE = 149
+BiomeType_MUTATED_JUNGLE_EDGE = 151
+BiomeType_MUTATED_BIRCH_FOREST = 155
+BiomeType_MUTATED_BIRCH_FOREST_HILLS = 156
+BiomeType_MUTATED_ROOFED_FOREST = 157
+BiomeType_MUTATED_TAIGA_COLD = 158
+BiomeType_MUTATED_REDWOOD_TAIGA = 160
+BiomeType_MUTATED_REDWOOD_TAIGA_HILLS = 161
+BiomeType_MUTATED_EXTREME_HILLS_WITH_TREES = 162
+BiomeType_MUTATED_SAVANNA = 163
+BiomeType_MUTATED_SAVANNA_ROCK = 164
+BiomeType_MUTATED_MESA = 165
+BiomeType_MUTATED_MESA_ROCK = 166
+BiomeType_MUTATED_MESA_CLEAR_ROCK = 167
+
+MoveMode_NORMAL = 0
+MoveMode_RESET = 1
+MoveMode_TELEPORT = 2
+MoveMode_PITCH = 3
+
+SoundType_ITEM_USE_ON = 0
+SoundType_HIT = 1
+SoundType_STEP = 2
+SoundType_FLY = 3
+SoundType_JUMP = 4
+SoundType_BREAK = 5
+SoundType_PLACE = 6
+SoundType_HEAVY_STEP = 7
+SoundType_GALLOP = 8
+SoundType_FALL = 9
+SoundType_AMBIENT = 10
+SoundType_AMBIENT_BABY = 11
+SoundType_AMBIENT_IN_WATER = 12
+SoundType_BREATHE = 13
+SoundType_DEATH = 14
+SoundType_DEATH_IN_WATER = 15
+SoundType_DEATH_TO_ZOMBIE = 16
+SoundType_HURT = 17
+SoundType_HURT_IN_WATER = 18
+SoundType_MAD = 19
+SoundType_BOOST = 20
+SoundType_BOW = 21
+SoundType_SQUISH_BIG = 22
+SoundType_SQUISH_SMALL = 23
+SoundType_FALL_BIG = 24
+SoundType_FALL_SMALL = 25
+SoundType_SPLASH = 26
+SoundType_FIZZ = 27
+SoundType_FLAP = 28
+SoundType_SWIM = 29
+SoundType_DRINK = 30
+SoundType_EAT = 31
+SoundType_TAKEOFF = 32
+SoundType_SHAKE = 33
+SoundType_PLOP = 34
+SoundType_LAND = 35
+SoundType_SADDLE = 36
+SoundType_ARMOR = 37
+SoundType_ADD_CHEST = 38
+SoundType_THROW = 39
+SoundType_ATTACK = 40
+SoundType_ATTACK_NO_DAMAGE = 41
+SoundType_ATTACK_STRONG = 42
+SoundType_WARN = 43
+SoundType_SHEAR = 44
+SoundType_MILK = 45
+SoundType_THUNDER = 46
+SoundType_EXPLODE = 47
+SoundType_FIRE = 48
+SoundType_IGNITE = 49
+SoundType_FUSE = 50
+SoundType_STARE = 51
+SoundType_SPAWN = 52
+SoundType_SHOOT = 53
+SoundType_BREAK_BLOCK = 54
+SoundType_LAUNCH = 55
+SoundType_BLAST = 56
+SoundType_LARGE_BLAST = 57
+SoundType_TWINKLE = 58
+SoundType_REMEDY = 59
+SoundType_UNFECT = 60
+SoundType_LEVEL_UP = 61
+SoundType_BOW_HIT = 62
+SoundType_BULLET_HIT = 63
+SoundType_EXTINGUISH_FIRE = 64
+SoundType_ITEM_FIZZ = 65
+SoundType_CHEST_OPEN = 66
+SoundType_CHEST_CLOSED = 67
+SoundType_SHULKERBOX_OPEN = 68
+SoundType_SHULKERBOX_CLOSED = 69
+SoundType_POWER_ON = 70
+SoundType_POWER_OFF = 71
+SoundType_ATTACH = 72
+SoundType_DETACH = 73
+SoundType_DENY = 74
+SoundType_TRIPOD = 75
+SoundType_POP = 76
+SoundType_DROP_SLOT = 77
+SoundType_NOTE = 78
+SoundType_THORNS = 79
+SoundType_PISTON_IN = 80
+SoundType_PISTON_OUT = 81
+SoundType_PORTAL = 82
+SoundType_WATER = 83
+SoundType_LAVA_POP = 84
+SoundType_LAVA = 85
+SoundType_BURP = 86
+SoundType_BUCKET_FILL_WATER = 87
+SoundType_BUCKET_FILL_LAVA = 88
+SoundType_BUCKET_EMPTY_WATER = 89
+SoundType_BUCKET_EMPTY_LAVA = 90
+SoundType_RECORD_13 = 91
+SoundType_RECORD_CAT = 92
+SoundType_RECORD_BLOCKS = 93
+SoundType_RECORD_CHIRP = 94
+SoundType_RECORD_FAR = 95
+SoundType_RECORD_MALL = 96
+SoundType_RECORD_MELLOHI = 97
+SoundType_RECORD_STAL = 98
+SoundType_RECORD_STRAD = 99
+SoundType_RECORD_WARD = 100
+SoundType_RECORD_11 = 101
+SoundType_RECORD_WAIT = 102
+SoundType_GUARDIAN_FLOP = 104
+SoundType_ELDERGUARDIAN_CURSE = 105
+SoundType_MOB_WARNING = 106
+SoundType_MOB_WARNING_BABY = 107
+SoundType_TELEPORT = 108
+SoundType_SHULKER_OPEN = 109
+SoundType_SHULKER_CLOSE = 110
+SoundType_HAGGLE = 111
+SoundType_HAGGLE_YES = 112
+SoundType_HAGGLE_NO = 113
+SoundType_HAGGLE_IDLE = 114
+SoundType_CHORUSGROW = 115
+SoundType_CHORUSDEATH = 116
+SoundType_GLASS = 117
+SoundType_CAST_SPELL = 118
+SoundType_PREPARE_ATTACK = 119
+SoundType_PREPARE_SUMMON = 120
+SoundType_PREPARE_WOLOLO = 121
+SoundType_FANG = 122
+SoundType_CHARGE = 123
+SoundType_CAMERA_TAKE_PICTURE = 124
+SoundType_LEASHKNOT_PLACE = 125
+SoundType_LEASHKNOT_BREAK = 126
+SoundType_GROWL = 127
+SoundType_WHINE = 128
+SoundType_PANT = 129
+SoundType_PURR = 130
+SoundType_PURREOW = 131
+SoundType_DEATH_MIN_VOLUME = 132
+SoundType_DEATH_MID_VOLUME = 133
+SoundType_IMITATE_BLAZE = 134
+SoundType_IMITATE_CAVE_SPIDER = 135
+SoundType_IMITATE_CREEPER = 136
+SoundType_IMITATE_ELDER_GUARDIAN = 137
+SoundType_IMITATE_ENDER_DRAGON = 138
+SoundType_IMITATE_ENDERMAN = 139
+SoundType_IMITATE_EVOCATION_ILLAGER = 141
+SoundType_IMITATE_GHAST = 142
+SoundType_IMITATE_HUSK = 143
+SoundType_IMITATE_ILLUSION_ILLAGER = 144
+SoundType_IMITATE_MAGMA_CUBE = 145
+SoundType_IMITATE_POLAR_BEAR = 146
+SoundType_IMITATE_SHULKER = 147
+SoundType_IMITATE_SILVERFISH = 148
+SoundType_IMITATE_SKELETON = 149
+SoundType_IMITATE_SLIME = 150
+SoundType_IMITATE_SPIDER = 151
+SoundType_IMITATE_STRAY = 152
+SoundType_IMITATE_VEX = 153
+SoundType_IMITATE_VINDICATION_ILLAGER = 154
+SoundType_IMITATE_WITCH = 155
+SoundType_IMITATE_WITHER = 156
+SoundType_IMITATE_WITHER_SKELETON = 157
+SoundType_IMITATE_WOLF = 158
+SoundType_IMITATE_ZOMBIE = 159
+SoundType_IMITATE_ZOMBIE_PIGMAN = 160
+SoundType_IMITATE_ZOMBIE_VILLAGER = 161
+SoundType_BLOCK_END_PORTAL_FRAME_FILL = 162
+SoundType_BLOCK_END_PORTAL_SPAWN = 163
+SoundType_RANDOM_ANVIL_USE = 164
+SoundType_BOTTLE_DRAGONBREATH = 165
+SoundType_DEFAULT = 166
+SoundType_UNDEFINED = 167
+
+PlayerActionType_START_BREAK = 0
+PlayerActionType_ABORT_BREAK = 1
+PlayerActionType_STOP_BREAK = 2
+PlayerActionType_GET_UPDATED_BLOCK = 3
+PlayerActionType_DROP_ITEM = 4
+PlayerActionType_START_SLEEPING = 5
+PlayerActionType_STOP_SLEEPING = 6
+PlayerActionType_RESPAWN = 7
+PlayerActionType_JUMP = 8
+PlayerActionType_START_SPRINT = 9
+PlayerActionType_STOP_SPRINT = 10
+PlayerActionType_START_SNEAK = 11
+PlayerActionType_STOP_SNEAK = 12
+PlayerActionType_DIMENSION_CHANGE_REQUEST = 13
+PlayerActionType_DIMENSION_CHANGE_ACK = 14
+PlayerActionType_START_GLIDE = 15
+PlayerActionType_STOP_GLIDE = 16
+PlayerActionType_BUILD_DENIED = 17
+PlayerActionType_CONTINUE_BREAK = 18
+PlayerActionType_SET_ENCHANTMENT_SEED = 20
+PlayerActionType_UNKNOWN_22 = 22
+PlayerActionType_UNKNOWN_24 = 24
+PlayerActionType_UNKNOWN_36 = 36
+
+TextType_RAW = 0
+TextType_CHAT = 1
+TextType_TRANSLATION = 2
+TextType_POPUP = 3
+TextType_JUKEBOX_POPUP = 4
+TextType_TIP = 5
+TextType_SYSTEM = 6
+TextType_WHISPER = 7
+TextType_ANNOUNCEMENT = 8
+
+EntityEventType_HURT_ANIMATION = 2
+EntityEventType_DEATH_ANIMATION = 3
+EntityEventType_ARM_SWING = 4
+EntityEventType_TAME_FAIL = 6
+EntityEventType_TAME_SUCCESS = 7
+EntityEventType_SHAKE_WET = 8
+EntityEventType_USE_ITEM = 9
+EntityEventType_EAT_GRASS_ANIMATION = 10
+EntityEventType_FISH_HOOK_BUBBLE = 11
+EntityEventType_FISH_HOOK_POSITION = 12
+EntityEventType_FISH_HOOK_HOOK = 13
+EntityEventType_FISH_HOOK_TEASE = 14
+EntityEventType_SQUID_INK_CLOUD = 15
+EntityEventType_ZOMBIE_VILLAGER_CURE = 16
+EntityEventType_RESPAWN = 18
+EntityEventType_IRON_GOLEM_OFFER_FLOWER = 19
+EntityEventType_IRON_GOLEM_WITHDRAW_FLOWER = 20
+EntityEventType_LOVE_PARTICLES = 21
+EntityEventType_WITCH_SPELL_PARTICLES = 24
+EntityEventType_FIREWORK_PARTICLES = 25
+EntityEventType_SILVERFISH_SPAWN_ANIMATION = 27
+EntityEventType_WITCH_DRINK_POTION = 29
+EntityEventType_WITCH_THROW_POTION = 30
+EntityEventType_MINECART_TNT_PRIME_FUSE = 31
+EntityEventType_PLAYER_ADD_XP_LEVELS = 34
+EntityEventType_ELDER_GUARDIAN_CURSE = 35
+EntityEventType_AGENT_ARM_SWING = 36
+EntityEventType_ENDER_DRAGON_DEATH = 37
+EntityEventType_DUST_PARTICLES = 38
+EntityEventType_EATING_ITEM = 57
+EntityEventType_BABY_ANIMAL_FEED = 60
+EntityEventType_DEATH_SMOKE_CLOUD = 61
+EntityEventType_COMPLETE_TRADE = 62
+EntityEventType_REMOVE_LEASH = 63
+EntityEventType_CONSUME_TOTEM = 65
+EntityEventType_PLAYER_CHECK_TREASURE_HUNTER_ACHIEVEMENT = 66
+EntityEventType_ENTITY_SPAWN = 67
+EntityEventType_DRAGON_PUKE = 68
+EntityEventType_ITEM_ENTITY_MERGE = 69
+
+SourceType_CONTAINER = 0
+SourceType_WORLD = 2
+SourceType_CREATIVE = 3
+SourceType_TODO = 99999
+
+EntityType_CHICKEN = 10
+EntityType_COW = 11
+EntityType_PIG = 12
+EntityType_SHEEP = 13
+EntityType_WOLF = 14
+EntityType_VILLAGER = 15
+EntityType_MOOSHROOM = 16
+EntityType_SQUID = 17
+EntityType_RABBIT = 18
+EntityType_BAT = 19
+EntityType_IRON_GOLEM = 20
+EntityType_SNOW_GOLEM = 21
+EntityType_OCELOT = 22
+EntityType_HORSE = 23
+EntityType_DONKEY = 24
+EntityType_MULE = 25
+EntityType_SKELETON_HORSE = 26
+EntityType_ZOMBIE_HORSE = 27
+EntityType_POLAR_BEAR = 28
+EntityType_LLAMA = 29
+EntityType_PARROT = 30
+EntityType_ZOMBIE = 32
+EntityType_CREEPER = 33
+EntityType_SKELETON = 34
+EntityType_SPIDER = 35
+EntityType_ZOMBIE_PIGMAN = 36
+EntityType_SLIME = 37
+EntityType_ENDERMAN = 38
+EntityType_SILVERFISH = 39
+EntityType_CAVE_SPIDER = 40
+EntityType_GHAST = 41
+EntityType_MAGMA_CUBE = 42
+EntityType_BLAZE = 43
+EntityType_ZOMBIE_VILLAGER = 44
+EntityType_WITCH = 45
+EntityType_STRAY = 46
+EntityType_HUSK = 47
+EntityType_WITHER_SKELETON = 48
+EntityType_GUARDIAN = 49
+EntityType_ELDER_GUARDIAN = 50
+EntityType_NPC = 51
+EntityType_WITHER = 52
+EntityType_ENDER_DRAGON = 53
+EntityType_SHULKER = 54
+EntityType_ENDERMITE = 55
+EntityType_LEARN_TO_CODE_MASCOT = 56
+EntityType_VINDICATOR = 57
+EntityType_ARMOR_STAND = 61
+EntityType_TRIPOD_CAMERA = 62
+EntityType_PLAYER = 63
+EntityType_ITEM = 64
+EntityType_TNT = 65
+EntityType_FALLING_BLOCK = 66
+EntityType_MOVING_BLOCK = 67
+EntityType_XP_BOTTLE = 68
+EntityType_XP_ORB = 69
+EntityType_EYE_OF_ENDER_SIGNAL = 70
+EntityType_ENDER_CRYSTAL = 71
+EntityType_FIREWORKS_ROCKET = 72
+EntityType_SHULKER_BULLET = 76
+EntityType_FISHING_HOOK = 77
+EntityType_CHALKBOARD = 78
+EntityType_DRAGON_FIREBALL = 79
+EntityType_ARROW = 80
+EntityType_SNOWBALL = 81
+EntityType_EGG = 82
+EntityType_PAINTING = 83
+EntityType_MINECART = 84
+EntityType_LARGE_FIREBALL = 85
+EntityType_SPLASH_POTION = 86
+EntityType_ENDER_PEARL = 87
+EntityType_LEASH_KNOT = 88
+EntityType_WITHER_SKULL = 89
+EntityType_BOAT = 90
+EntityType_WITHER_SKULL_DANGEROUS = 91
+EntityType_LIGHTNING_BOLT = 93
+EntityType_SMALL_FIREBALL = 94
+EntityType_AREA_EFFECT_CLOUD = 95
+EntityType_HOPPER_MINECART = 96
+EntityType_TNT_MINECART = 97
+EntityType_CHEST_MINECART = 98
+EntityType_COMMAND_BLOCK_MINECART = 100
+EntityType_LINGERING_POTION = 101
+EntityType_LLAMA_SPIT = 102
+EntityType_EVOCATION_FANG = 103
+EntityType_EVOCATION_ILLAGER = 104
+EntityType_VEX = 105
@@ -1,6 +1,6 @@
 import pickle
 import sqlite3
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 
 from pyminehub.config import ConfigKey, get_value
 from pyminehub.mcpe.chunk import Chunk, encode_chunk, decode_chunk
@@ -24,6 +24,10 @@ class DataStore:
     def save_chunk(self, position: ChunkPosition, chunk: Chunk, insert_only=False) -> None:
         raise NotImplementedError()
 
+    def save_chunks(self, chunks: Iterable[Tuple[ChunkPosition, Chunk]], insert_only=False) -> None:
+        for position, chunk in chunks:
+            self.save_chunk(position, chunk, insert_only)
+
     def load_chunk(self, position: ChunkPosition) -> Optional[Chunk]:
         raise NotImplementedError()
 
@@ -65,6 +69,15 @@ class _DataBase(DataStore):
             self._connection.execute(
                 'INSERT OR IGNORE INTO chunk(data,x,z) VALUES(?,?,?)', param)
 
+    def save_chunks(self, chunks: Iterable[Tuple[ChunkPosition, Chunk]], insert_only=False) -> None:
+        params = [(encode_chunk(chunk), position.x, position.z) for position, chunk in chunks]
+        with self._connection:  # in a single transaction
+            if not insert_only:
+                self._connection.executemany(
+                    'UPDATE chunk SET data=? WHERE x=? AND z=?', params)
+            self._connection.executemany(
+                'INSERT OR IGNORE INTO chunk(data,x,z) VALUES(?,?,?)', params)
+
     def load_chunk(self, position: ChunkPosition) -> Optional[Chunk]:
         param = (position.x, position.z)
         row = self._connection.execute('SELECT data FROM chunk WHERE x=? AND z=?', param).fetchone()
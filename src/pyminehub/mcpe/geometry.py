@@ -214,7 +214,13 @@ class Face(Enum):
 
     @property
     def inverse(self) -> 'Face':
-        return Face(self.value ^ 1) if self is not self.NONE else self
+        """
+        >>> Face.SOUTH.inverse
+        <Face.NORTH: 3>
+        >>> Face.NONE.inverse
+        <Face.NONE: -1>
+        """
+        return self._inverse
 
     @classmethod
     def by_yaw(cls, yaw: float) -> 'Face':
@@ -274,6 +280,10 @@ class Face(Enum):
         return cls.by_yaw(yaw)
 
 
+for _face in Face:
+    _face._inverse = Face(_face.value ^ 1) if _face is not Face.NONE else _face
+
+
 class OrientedBoundingBox(NamedTuple('OrientedBoundingBox', [
     ('origin', Vector3[float]),
     ('forward', Vector3[float]),
@@ -68,6 +68,11 @@ _ENTITY_METADATA_TYPE = {
     EntityMetaDataKey.MAX_STRENGTH: MetaDataType.INT
 }
 
+# indexed by EntityMetaDataKey value
+_ENTITY_METADATA_TYPE_LIST = [None] * (max(_ENTITY_METADATA_TYPE) + 1)
+for _key, _data_type in _ENTITY_METADATA_TYPE.items():
+    _ENTITY_METADATA_TYPE_LIST[_key] = _data_type
+
 
 # noinspection PyTypeChecker
 _TYPE_CHECKER = {
@@ -84,6 +89,6 @@ _TYPE_CHECKER = {
 
 
 def create_entity_metadata(key: EntityMetaDataKey, value: MetaDataValue) -> EntityMetaData:
-    data_type = _ENTITY_METADATA_TYPE[key]
+    data_type = _ENTITY_METADATA_TYPE_LIST[key]
     assert _TYPE_CHECKER[data_type](value)
     return EntityMetaData(key, data_type, value)
@@ -1,5 +1,6 @@
 import asyncio
 import uuid
+from collections import deque
 from enum import Enum
 from logging import getLogger
 from random import randrange
@@ -32,6 +33,21 @@ __all__ = [
 
 _logger = getLogger(__name__)
 
+_CHUNK_RADIUS = 8
+
+# packets whose fields are all constant
+_RESOURCE_PACK_COMPLETED_PACKET = game_packet_factory.create(
+    GamePacketType.RESOURCE_PACK_CLIENT_RESPONSE,
+    EXTRA_DATA,
+    ResourcePackStatus.COMPLETED,
+    ()
+)
+_REQUEST_CHUNK_RADIUS_PACKET = game_packet_factory.create(
+    GamePacketType.REQUEST_CHUNK_RADIUS,
+    EXTRA_DATA,
+    _CHUNK_RADIUS
+)
+
 
 class EntityEvent(Enum):
     ADDED = 1
@@ -59,6 +75,8 @@ EntityEventListener = Callable[[EntityEvent, EntityInfo], None]
 
 class _MutableEntityInfo:
 
+    __slots__ = ('_entity_runtime_id', '_name', '_metadata', '_position', '_pitch', '_yaw', '_head_yaw')
+
     def __init__(self, entity_runtime_id: EntityRuntimeID, name: str) -> None:
         self._entity_runtime_id = entity_runtime_id
         self._name = name
@@ -123,6 +141,12 @@ class _MutableEntityInfo:
     def head_yaw(self, value: float) -> None:
         self._head_yaw = value
 
+    def move(self, position: Vector3[float], pitch: float, yaw: float, head_yaw: float) -> None:
+        self._position = position
+        self._pitch = pitch
+        self._yaw = yaw
+        self._head_yaw = head_yaw
+
     @property
     def metadata(self) -> Tuple[EntityMetaData, ...]:
         return tuple(self._metadata.values())
@@ -146,7 +170,8 @@ class _MCPEClientHandler(MCPEDataHandler):
         self._player_name = None  # type: str
         self._command_usage = []  # type: List[str]
         self._entities = {}  # type: Dict[EntityRuntimeID, _MutableEntityInfo]
-        self._messages = []  # type: List[str]
+        self._entities_cache = None  # type: Optional[Tuple[EntityInfo, ...]]  # None if entities are updated
+        self._messages = deque()  # type: deque
         self._latest_chunk = None  # type: ChunkInfo
         self._processed = asyncio.Event()
         self._listener = None  # type: Optional[EntityEventListener]
@@ -193,13 +218,15 @@ class _MCPEClientHandler(MCPEDataHandler):
 
     @property
     def entities(self) -> Tuple[EntityInfo, ...]:
-        return tuple(entity.value for entity in self._entities.values())
+        if self._entities_cache is None:
+            self._entities_cache = tuple(entity.value for entity in self._entities.values())
+        return self._entities_cache
 
     def get_entity(self, entity_runtime_id: EntityRuntimeID) -> Optional[EntityInfo]:
         return self._entities[entity_runtime_id].value if entity_runtime_id in self._entities else None
 
     def next_message(self) -> Optional[str]:
-        return self._messages.pop(0) if len(self._messages) > 0 else None
+        return self._messages.popleft() if len(self._messages) > 0 else None
 
     def set_entity_event_listener(self, listener: Optional[EntityEventListener]) -> None:
         self._listener = listener
@@ -282,13 +309,7 @@ class _MCPEClientHandler(MCPEDataHandler):
 
     # noinspection PyUnusedLocal
     def _process_resource_packs_info(self, packet: GamePacket, addr: Address) -> None:
-        send_packet = game_packet_factory.create(
-            GamePacketType.RESOURCE_PACK_CLIENT_RESPONSE,
-            EXTRA_DATA,
-            ResourcePackStatus.COMPLETED,
-            ()
-        )
-        self.send_game_packet(send_packet, addr)
+        self.send_game_packet(_RESOURCE_PACK_COMPLETED_PACKET, addr)
 
     # noinspection PyUnusedLocal
     def _process_play_status(self, packet: GamePacket, addr: Address) -> None:
@@ -305,6 +326,7 @@ class _MCPEClientHandler(MCPEDataHandler):
         entity.pitch = packet.pitch
         entity.yaw = packet.yaw
         self._entities[entity.entity_runtime_id] = entity
+        self._entities_cache = None
 
     def _process_set_time(self, packet: GamePacket, addr: Address) -> None:
         pass
@@ -316,6 +338,7 @@ class _MCPEClientHandler(MCPEDataHandler):
     def _process_set_entity_data(self, packet: GamePacket, addr: Address) -> None:
         entity = self._entities[packet.entity_runtime_id]
         entity.metadata = packet.metadata
+        self._entities_cache = None
 
     # noinspection PyUnusedLocal
     def _process_available_commands(self, packet: GamePacket, addr: Address) -> None:
@@ -346,12 +369,7 @@ class _MCPEClientHandler(MCPEDataHandler):
             for player in packet.entries:
                 _logger.info('[%d] %s', player.entity_unique_id, player.user_name)
             if not self._is_active.is_set():
-                send_packet = game_packet_factory.create(
-                    GamePacketType.REQUEST_CHUNK_RADIUS,
-                    EXTRA_DATA,
-                    8
-                )
-                self.send_game_packet(send_packet, addr)
+                self.send_game_packet(_REQUEST_CHUNK_RADIUS_PACKET, addr)
 
     def _process_chunk_radius_updated(self, packet: GamePacket, addr: Address) -> None:
         pass
@@ -364,29 +382,26 @@ class _MCPEClientHandler(MCPEDataHandler):
     def _process_add_player(self, packet: GamePacket, addr: Address) -> None:
         assert packet.entity_runtime_id == packet.entity_unique_id
         entity = _MutableEntityInfo(packet.entity_runtime_id, packet.user_name)
-        entity.position = packet.position
-        entity.pitch = packet.pitch
-        entity.yaw = packet.yaw
-        entity.head_yaw = packet.head_yaw
+        entity.move(packet.position, packet.pitch, packet.yaw, packet.head_yaw)
         entity.metadata = packet.metadata
         self._entities[entity.entity_runtime_id] = entity
+        self._entities_cache = None
         if self._listener is not None:
             self._listener(EntityEvent.ADDED, entity.value)
 
     # noinspection PyUnusedLocal
     def _process_move_player(self, packet: GamePacket, addr: Address) -> None:
-        entity = self._entities[packet.entity_runtime_id]
-        entity.position = packet.position
-        entity.pitch = packet.pitch
-        entity.yaw = packet.yaw
-        entity.head_yaw = packet.head_yaw
+        self._entities[packet.entity_runtime_id].move(packet.position, packet.pitch, packet.yaw, packet.head_yaw)
+        self._entities_cache = None
         self._processed.set()
 
     # noinspection PyUnusedLocal
     def _process_text(self, packet: GamePacket, addr: Address) -> None:
         # TODO check text_type and needs_translation
-        parameters = tuple(str(p) for p in packet.parameters)
-        message = '{} ({})'.format(packet.message, ', '.join(parameters)) if len(parameters) > 0 else packet.message
+        if len(packet.parameters) > 0:
+            message = '{} ({})'.format(packet.message, ', '.join(map(str, packet.parameters)))
+        else:
+            message = packet.message
         _logger.info('%s: %s', packet.type.name, message)
         self._messages.append(message)
         self._processed.set()
@@ -400,6 +415,7 @@ class _MCPEClientHandler(MCPEDataHandler):
         entity.yaw = packet.yaw
         entity.metadata = packet.metadata
         self._entities[entity.entity_runtime_id] = entity
+        self._entities_cache = None
         if self._listener is not None:
             self._listener(EntityEvent.ADDED, entity.value)
         self._processed.set()
@@ -408,17 +424,15 @@ class _MCPEClientHandler(MCPEDataHandler):
     def _process_remove_entity(self, packet: GamePacket, addr: Address) -> None:
         entity = self._entities[packet.entity_unique_id]
         del self._entities[packet.entity_unique_id]  # TODO map unique_id to runtime_id
+        self._entities_cache = None
         if self._listener is not None:
             self._listener(EntityEvent.REMOVED, entity.value)
         self._processed.set()
 
     # noinspection PyUnusedLocal
     def _process_move_entity(self, packet: GamePacket, addr: Address) -> None:
-        entity = self._entities[packet.entity_runtime_id]
-        entity.position = packet.position
-        entity.pitch = packet.pitch
-        entity.yaw = packet.yaw
-        entity.head_yaw = packet.head_yaw
+        self._entities[packet.entity_runtime_id].move(packet.position, packet.pitch, packet.yaw, packet.head_yaw)
+        self._entities_cache = None
         self._processed.set()
 
     # noinspection PyUnusedLocal
@@ -434,6 +448,7 @@ class _MCPEClientHandler(MCPEDataHandler):
         entity.position = packet.position
         entity.metadata = packet.metadata
         self._entities[entity.entity_runtime_id] = entity
+        self._entities_cache = None
         self._processed.set()
 
     def _process_take_item_entity(self, packet: GamePacket, addr: Address) -> None:
@@ -486,23 +501,16 @@ class MCPEClient(AbstractClient):
 
     # local methods
 
-    @staticmethod
-    async def _timeout(future: asyncio.Future, time: float) -> None:
-        await asyncio.sleep(time)
-        future.cancel()
-
     def wait_response(self, timeout: float=0) -> bool:
         """Wait until it receives a packet
         :param timeout: seconds. If it is 0 then timeout does not occur.
         :return: False if timeout occurred.
         """
-        wait_future = asyncio.ensure_future(self._handler.wait_response())
-        if timeout > 0:
-            asyncio.ensure_future(self._timeout(wait_future, timeout))
         try:
-            asyncio.get_event_loop().run_until_complete(wait_future)
+            asyncio.get_event_loop().run_until_complete(
+                asyncio.wait_for(self._handler.wait_response(), timeout if timeout > 0 else None))
             return True
-        except asyncio.CancelledError:
+        except asyncio.TimeoutError:
             return False
 
     @property
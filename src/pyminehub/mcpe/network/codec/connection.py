@@ -1,13 +1,13 @@
 """
 Codecs for connection packet
 """
-import zlib
-from typing import Tuple
+from typing import Tuple, Union
 
-from pyminehub.binutil.converter import pop_first, DataCodecContext, DataCodec
+from pyminehub.binutil.converter import BytesOperationError, DataCodecContext, DataCodec
 from pyminehub.binutil.instance import *
-from pyminehub.config import get_value, ConfigKey
+from pyminehub.config import add_listener, ConfigKey
 from pyminehub.mcpe.network.packet import ConnectionPacketType, connection_packet_factory
+from pyminehub.mcpe.network.zlib_fast import compress, decompress
 from pyminehub.network.address import AddressInPacket
 from pyminehub.network.codec import PacketCodec, ADDRESS_DATA
 
@@ -33,29 +33,48 @@ class _CompressedPacketList(DataCodec[Tuple[bytes, ...]]):
 
     _COMPRESS_LEVEL = 7
 
-    @staticmethod
-    def _does_compress(payload: bytes) -> bool:
-        return len(payload) >= get_value(ConfigKey.BATCH_COMPRESS_THRESHOLD)
+    def __init__(self) -> None:
+        self._compress_threshold = 0
+        add_listener(ConfigKey.BATCH_COMPRESS_THRESHOLD, self._set_compress_threshold)
+
+    def _set_compress_threshold(self, threshold: int) -> None:
+        self._compress_threshold = threshold
 
     def read(self, data: bytearray, context: DataCodecContext) -> Tuple[bytes, ...]:
-        payload = bytearray(zlib.decompress(data))
+        payload = decompress(data)
         context.length += len(data)
         del data[:]
-        local_context = DataCodecContext()
         payloads = []
-        while len(payload) > 0:
-            length = VAR_INT_DATA.read(payload, local_context)
-            d = pop_first(payload, length)
-            payloads.append(bytes(d))
+        payload_length = len(payload)
+        offset = 0
+        while offset < payload_length:
+            length = payload[offset]
+            if length < 0x80:  # one byte VarInt, for sub-packets shorter than 128 bytes
+                offset += 1
+            else:
+                length, offset = VAR_INT_DATA.read_from(payload, offset)
+            next_offset = offset + length
+            if next_offset > payload_length:
+                raise BytesOperationError(
+                    'Data length is less than specified size. ({} < {})'.format(payload_length - offset, length))
+            payloads.append(payload[offset:next_offset])
+            offset = next_offset
         return tuple(payloads)
 
-    def write(self, data: bytearray, value: Tuple[bytes, ...], context: DataCodecContext) -> None:
-        local_context = DataCodecContext()
-        payload = bytearray()
-        for v in value:
-            VAR_INT_DATA.write(payload, len(v), local_context)
-            payload += v
-        compressed_data = zlib.compress(payload, self._COMPRESS_LEVEL if self._does_compress(payload) else 0)
+    def write(self, data: bytearray, value: Union[Tuple[bytes, ...], bytes], context: DataCodecContext) -> None:
+        if isinstance(value, bytes):
+            payload = value  # already prefixed by length
+        else:
+            parts = []
+            length_context = DataCodecContext()
+            for v in value:
+                length = bytearray()
+                VAR_INT_DATA.write(length, len(v), length_context)
+                parts.append(length)
+                parts.append(v)
+            payload = b''.join(parts)  # allocate once with the total size
+        level = self._COMPRESS_LEVEL if len(payload) >= self._compress_threshold else 0
+        compressed_data = compress(payload, level)
         data += compressed_data
         context.length += len(compressed_data)
 
@@ -106,22 +106,24 @@ _GAME_RULE_TYPE_DATA = EnumData(VAR_INT_DATA, GameRuleType)
 
 class _GameRule(DataCodec[GameRule]):
 
-    _VALUE_DATA_MAP = {
-        GameRuleType.BOOL: BOOL_DATA,
-        GameRuleType.INT: VAR_INT_DATA,
-        GameRuleType.FLOAT: L_FLOAT_DATA
-    }
+    # indexed by GameRuleType value
+    _VALUE_DATA_LIST = (
+        None,
+        BOOL_DATA,  # BOOL
+        VAR_INT_DATA,  # INT
+        L_FLOAT_DATA  # FLOAT
+    )
 
     def read(self, data: bytearray, context: DataCodecContext) -> GameRule:
         rule_name = VAR_STRING_DATA.read(data, context)
         rule_type = _GAME_RULE_TYPE_DATA.read(data, context)
-        rule_value = self._VALUE_DATA_MAP[rule_type].read(data, context)
+        rule_value = self._VALUE_DATA_LIST[rule_type].read(data, context)
         return GameRule(rule_name, rule_type, rule_value)
 
     def write(self, data: bytearray, value: GameRule, context: DataCodecContext) -> None:
         VAR_STRING_DATA.write(data, value.name, context)
         _GAME_RULE_TYPE_DATA.write(data, value.type, context)
-        self._VALUE_DATA_MAP[value.type].write(data, value.value, context)
+        self._VALUE_DATA_LIST[value.type].write(data, value.value, context)
 
 
 class _CommandEnumIndex(DataCodec[int]):
@@ -176,25 +178,26 @@ class _InventoryContentItems(DataCodec[Tuple[Item, ...]]):
 
 class _MetaDataValue(DataCodec[MetaDataValue]):
 
-    _DATA_CODEC_MAP = {
-        MetaDataType.BYTE: BYTE_DATA,
-        MetaDataType.SHORT: L_SHORT_DATA,
-        MetaDataType.INT: VAR_INT_DATA,
-        MetaDataType.FLOAT: L_FLOAT_DATA,
-        MetaDataType.STRING: VAR_STRING_DATA,
-        MetaDataType.ITEM: _ITEM_DATA,
-        MetaDataType.INT_VECTOR3: _INT_VECTOR3_DATA,
-        MetaDataType.LONG: VAR_INT_DATA,
-        MetaDataType.FLOAT_VECTOR3: _FLOAT_VECTOR3_DATA
-    }
+    # indexed by MetaDataType value
+    _DATA_CODEC_LIST = (
+        BYTE_DATA,  # BYTE
+        L_SHORT_DATA,  # SHORT
+        VAR_INT_DATA,  # INT
+        L_FLOAT_DATA,  # FLOAT
+        VAR_STRING_DATA,  # STRING
+        _ITEM_DATA,  # ITEM
+        _INT_VECTOR3_DATA,  # INT_VECTOR3
+        VAR_INT_DATA,  # LONG
+        _FLOAT_VECTOR3_DATA  # FLOAT_VECTOR3
+    )
 
     def read(self, data: bytearray, context: CompositeCodecContext) -> MetaDataValue:
         metadata_type = context['metadata_type']
-        return self._DATA_CODEC_MAP[metadata_type].read(data, context)
+        return self._DATA_CODEC_LIST[metadata_type].read(data, context)
 
     def write(self, data: bytearray, value: MetaDataValue, context: CompositeCodecContext) -> None:
         metadata_type = context['metadata_type']
-        self._DATA_CODEC_MAP[metadata_type].write(data, value, context)
+        self._DATA_CODEC_LIST[metadata_type].write(data, value, context)
 
 
 _UUID_DATA = ValueFilter(RawData(16), read=lambda _data: UUID(bytes=_data), write=lambda _value: _value.bytes)
@@ -538,11 +541,11 @@ _game_data_codecs = {
         _HEADER_EXTRA_DATA,
         NamedData('text_type', EnumData(BYTE_DATA, TextType)),
         BOOL_DATA,
-        OptionalData(VAR_STRING_DATA, lambda _context: not _context['text_type'].with_source),
+        OptionalData(VAR_STRING_DATA, lambda _context: not TEXT_TYPE_WITH_SOURCE[_context['text_type']]),
         VAR_STRING_DATA,
         OptionalData(
             VarListData(VAR_INT_DATA, VAR_STRING_DATA),
-            lambda _context: not _context['text_type'].with_parameters
+            lambda _context: not TEXT_TYPE_WITH_PARAMETERS[_context['text_type']]
         ),
         VAR_STRING_DATA
     ],
@@ -656,7 +659,7 @@ _game_data_codecs = {
         _HEADER_EXTRA_DATA,
         _BLOCK_POSITION_DATA,
         CompositeData(Block, (
-            EnumData(VAR_INT_DATA, BlockType),
+            EnumData(VAR_INT_DATA, block_type_from_id),
             VAR_INT_DATA,
         ))
     ],
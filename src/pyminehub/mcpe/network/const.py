@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 __all__ = [
@@ -16,7 +16,7 @@ __all__ = [
 GUEST_XUID = ':GUEST:'
 
 
-class PlayStatus(Enum):
+class PlayStatus(IntEnum):
     LOGIN_SUCCESS = 0
     LOGIN_FAILED_CLIENT = 1
     LOGIN_FAILED_SERVER = 2
@@ -26,19 +26,19 @@ class PlayStatus(Enum):
     LOGIN_FAILED_EDU_VANILLA = 6
 
 
-class ResourcePackStatus(Enum):
+class ResourcePackStatus(IntEnum):
     REFUSED = 1
     SEND_PACKS = 2
     HAVE_ALL_PACKS = 3
     COMPLETED = 4
 
 
-class PlayerListType(Enum):
+class PlayerListType(IntEnum):
     ADD = 0
     REMOVE = 1
 
 
-class InventoryTransactionType(Enum):
+class InventoryTransactionType(IntEnum):
     NORMAL = 0
     MISMATCH = 1
     USE_ITEM = 2
@@ -242,7 +242,7 @@ def _spawn_player(
             TextType.TRANSLATION,
             False,
             None,
-            EscapeSequence.YELLOW.value + '%multiplayer.player.joined',
+            EscapeSequence.YELLOW + '%multiplayer.player.joined',
             (player.name, ),
             ''
         )
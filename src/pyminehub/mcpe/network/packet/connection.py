@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Tuple, Union
 
 from pyminehub.network.address import AddressInPacket
 from pyminehub.value import ValueType, ValueObject, ValueObjectFactory
@@ -59,7 +59,7 @@ _connection_packet_specs = {
     ],
     ConnectionPacketType.BATCH: [
         ('type', ConnectionPacketType),
-        ('payloads', Tuple[bytes, ...])
+        ('payloads', Union[Tuple[bytes, ...], bytes])  # bytes is the list already prefixed by length
     ]
 }
 
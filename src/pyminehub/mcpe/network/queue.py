@@ -1,7 +1,9 @@
-from collections import defaultdict
 from logging import getLogger
 from typing import Callable, Dict, List, Tuple
 
+from pyminehub.binutil.composite import CompositeCodecContext
+from pyminehub.binutil.converter import DataCodecContext
+from pyminehub.binutil.instance import VAR_INT_DATA
 from pyminehub.mcpe.network.codec import game_packet_codec
 from pyminehub.mcpe.network.packet import GamePacket, ConnectionPacket, ConnectionPacketType, connection_packet_factory
 from pyminehub.mcpe.network.reliability import RELIABILITY_DICT
@@ -33,16 +35,24 @@ class _BatchQueue:
     def send(self, sendto: Callable[[ConnectionPacket, Reliability], None]) -> None:
         if len(self._packets) == 0:
             return
-        payloads = []
-        last_reliability = None
+        context = DataCodecContext()
+        packet_context = CompositeCodecContext()  # reused for each packet
+        payload = bytearray()  # encoded packets prefixed by length, as BATCH packet contains
+        encoded = bytearray()
+        last_reliability = self._packets[0][0]
         for reliability, packet in self._packets:
-            if last_reliability is not None and last_reliability != reliability:
-                batch_packet = connection_packet_factory.create(ConnectionPacketType.BATCH, payloads)
+            # reliabilities are shared constants of RELIABILITY_DICT, so identity is enough
+            if reliability is not last_reliability:
+                batch_packet = connection_packet_factory.create(ConnectionPacketType.BATCH, bytes(payload))
                 sendto(batch_packet, last_reliability)
-                payloads = []
-            payloads.append(game_packet_codec.encode(packet))
+                payload.clear()
+            encoded.clear()
+            packet_context.clear()
+            game_packet_codec.encode_into(packet, encoded, packet_context)
+            VAR_INT_DATA.write(payload, len(encoded), context)
+            payload += encoded
             last_reliability = reliability
-        batch_packet = connection_packet_factory.create(ConnectionPacketType.BATCH, payloads)
+        batch_packet = connection_packet_factory.create(ConnectionPacketType.BATCH, bytes(payload))
         sendto(batch_packet, last_reliability)
         self._packets.clear()
 
@@ -51,7 +61,7 @@ class GamePacketQueue:
 
     def __init__(self, send_connection_packet: Callable[[ConnectionPacket, Address, Reliability], None]) -> None:
         self._send_connection_packet = send_connection_packet
-        self._batch_queue = defaultdict(_BatchQueue)  # type: Dict[Address, _BatchQueue]
+        self._batch_queue = {}  # type: Dict[Address, _BatchQueue]
 
     def append(self, packet: GamePacket, addr: Address) -> None:
         """Register batch request.
@@ -59,12 +69,23 @@ class GamePacketQueue:
         :param packet: game packet
         :param addr: destination
         """
-        self._batch_queue[addr].append(packet)
+        queue = self._batch_queue.get(addr)
+        if queue is None:
+            queue = self._batch_queue[addr] = _BatchQueue()
+        queue.append(packet)
 
     def send(self) -> None:
-        for addr, queue in self._batch_queue.items():
-            queue.send(lambda _packet, _reliability: self._send_connection_packet(_packet, addr, _reliability))
+        for addr in self._batch_queue:
+            self._send(addr)
 
     def send_immediately(self, packet: GamePacket, addr: Address) -> None:
+        """Send packet with the packets waiting for the same destination.
+
+        Packets waiting for other destinations are left to be sent together by the next `send`.
+        """
         self.append(packet, addr)
-        self.send()
+        self._send(addr)
+
+    def _send(self, addr: Address) -> None:
+        self._batch_queue[addr].send(
+            lambda _packet, _reliability: self._send_connection_packet(_packet, addr, _reliability))
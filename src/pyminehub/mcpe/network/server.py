@@ -17,7 +17,7 @@ from pyminehub.mcpe.network.player import Player
 from pyminehub.mcpe.network.reliability import DEFAULT_CHANEL
 from pyminehub.mcpe.network.session import SessionManager
 from pyminehub.mcpe.network.value import PlayerListEntry
-from pyminehub.mcpe.value import EntityMetaData, EntityMetaDataFlagValue
+from pyminehub.mcpe.value import EntityMetaData
 from pyminehub.mcpe.world import WorldProxy
 from pyminehub.network.address import Address, to_packet_format
 from pyminehub.network.handler import SessionNotFound
@@ -80,7 +80,7 @@ class MCPEServerHandler(MCPEDataHandler):
             TextType.TRANSLATION,
             False,
             None,
-            EscapeSequence.YELLOW.value + '%multiplayer.player.left',
+            EscapeSequence.YELLOW + '%multiplayer.player.left',
             (player.name, ),
             ''
         )
@@ -131,9 +131,8 @@ class MCPEServerHandler(MCPEDataHandler):
     def _mob_spawned_event_to_metadata(event: Event) -> Tuple[EntityMetaData, ...]:
         metadata = []
         if event.name is not None:
-            metadata.append(create_entity_metadata(EntityMetaDataKey.FLAGS, EntityMetaDataFlagValue.create(
-                always_show_nametag=True
-            ).flags))
+            metadata.append(create_entity_metadata(
+                EntityMetaDataKey.FLAGS, ENTITY_METADATA_FLAG_MASK[EntityMetaDataFlag.ALWAYS_SHOW_NAMETAG]))
             metadata.append(create_entity_metadata(EntityMetaDataKey.NAMETAG, event.name))
         if event.owner_runtime_id is not None:
             metadata.append(create_entity_metadata(EntityMetaDataKey.OWNER_EID, event.owner_runtime_id))
@@ -0,0 +1,39 @@
+"""
+zlib compatible compression which uses ISA-L when it is installed
+"""
+import zlib
+
+try:
+    # noinspection PyUnresolvedReferences
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+__all__ = [
+    'compress',
+    'decompress'
+]
+
+
+def _isal_compress(data: bytes, level: int) -> bytes:
+    """Compress by ISA-L, which supports only levels 0 to 3.
+
+    Level 0 is delegated to zlib because it means stored (uncompressed) blocks in zlib
+    but the fastest compression in ISA-L.
+    """
+    if level == 0:
+        return zlib.compress(data, 0)
+    return isal_zlib.compress(data, min(level, isal_zlib.ISAL_BEST_COMPRESSION))
+
+
+if isal_zlib is not None:
+    compress = _isal_compress
+    decompress = isal_zlib.decompress
+else:
+    compress = zlib.compress
+    decompress = zlib.decompress
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest_result = doctest.testmod()
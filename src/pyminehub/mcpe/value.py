@@ -51,6 +51,10 @@ Attribute = NamedTuple('Attribute', [
 ])
 
 
+_ADVENTURE_SETTING_FLAG1_KEYS = tuple((flag.name.lower(), flag) for flag in AdventureSettingFlag1)
+_ADVENTURE_SETTING_FLAG2_KEYS = tuple((flag.name.lower(), flag) for flag in AdventureSettingFlag2)
+
+
 class AdventureSettings(NamedTuple('AdventureSettings', [
     ('flags', int),
     ('flags2', int)
@@ -61,18 +65,20 @@ class AdventureSettings(NamedTuple('AdventureSettings', [
         >>> AdventureSettings.create(world_immutable=True, attack_players=True, flying=True, teleport=True)
         AdventureSettings(flags=513, flags2=136)
         """
-        flags = dict_to_flags(AdventureSettingFlag1, **kwargs)
-        flags2 = dict_to_flags(AdventureSettingFlag2, **kwargs)
-        return AdventureSettings(flags, flags2)
+        return AdventureSettings(*pack_adventure_flags(
+            (flag for key, flag in _ADVENTURE_SETTING_FLAG1_KEYS if kwargs.get(key, False)),
+            (flag for key, flag in _ADVENTURE_SETTING_FLAG2_KEYS if kwargs.get(key, False))
+        ))
 
     def to_dict(self) -> Dict[str, bool]:
         """
         >>> sorted(AdventureSettings(513, 136).to_dict().items())
         [('attack_players', True), ('flying', True), ('teleport', True), ('world_immutable', True)]
         """
-        d = {}
-        d.update(flags_to_dict(AdventureSettingFlag1, self.flags))
-        d.update(flags_to_dict(AdventureSettingFlag2, self.flags2))
+        d = dict(
+            (key, True) for key, flag in _ADVENTURE_SETTING_FLAG1_KEYS if self.flags & ADVENTURE_FLAG1_MASKS[flag])
+        d.update(
+            (key, True) for key, flag in _ADVENTURE_SETTING_FLAG2_KEYS if self.flags2 & ADVENTURE_FLAG2_MASKS[flag])
         return d
 
 
@@ -115,6 +121,10 @@ EntityMetaData = NamedTuple('EntityMetaData', [
 ])
 
 
+_ENTITY_METADATA_FLAG_KEYS = tuple(
+    (flag.name.lower(), ENTITY_METADATA_FLAG_MASK[flag]) for flag in EntityMetaDataFlag)
+
+
 class EntityMetaDataFlagValue(NamedTuple('EntityMetaDataFlags', [
     ('flags', int)
 ])):
@@ -124,14 +134,15 @@ class EntityMetaDataFlagValue(NamedTuple('EntityMetaDataFlags', [
         >>> EntityMetaDataFlagValue.create(always_show_nametag=True, immobile=True, swimmer=True)
         EntityMetaDataFlagValue(flags=1146880)
         """
-        return EntityMetaDataFlagValue(dict_to_flags(EntityMetaDataFlag, **kwargs))
+        return EntityMetaDataFlagValue(
+            sum(mask for key, mask in _ENTITY_METADATA_FLAG_KEYS if kwargs.get(key, False)))
 
     def to_dict(self) -> Dict[str, bool]:
         """
         >>> sorted(EntityMetaDataFlagValue(1146880).to_dict().items())
         [('always_show_nametag', True), ('immobile', True), ('swimmer', True)]
         """
-        return flags_to_dict(EntityMetaDataFlag, self.flags)
+        return dict((key, True) for key, mask in _ENTITY_METADATA_FLAG_KEYS if self.flags & mask)
 
 
 EntityAttribute = NamedTuple('EntityAttribute', [
@@ -139,11 +139,11 @@ class _World(WorldEditor):
         self.perform(action_factory.create(action_type, *args, **kwargs))
 
     async def _next_moment(self) -> None:
-        start_time = time.time()
+        start_time = time.monotonic()
         self._world_extension.update(self._perform_action)
         if get_value(ConfigKey.SPAWN_MOB):
             self._update_mob()
-        run_time = time.time() - start_time
+        run_time = time.monotonic() - start_time
         tick_time = get_value(ConfigKey.WORLD_TICK_TIME)
         if run_time < tick_time:
             await asyncio.sleep(tick_time - run_time)
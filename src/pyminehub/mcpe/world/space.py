@@ -1,6 +1,8 @@
+from collections import OrderedDict
 from functools import partial
 from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
+from pyminehub.config import ConfigKey, get_value
 from pyminehub.mcpe.block import FunctionalBlock
 from pyminehub.mcpe.chunk import Chunk
 from pyminehub.mcpe.const import BlockType
@@ -50,8 +52,7 @@ class _BlockCache:
     ) -> None:
         chunk, position_in_chunk = producer(position)
         self._position = position
-        self._chunk = chunk
-        self._position_in_chunk = position_in_chunk
+        self._producer = producer
         self._block = chunk.get_block(position_in_chunk)
 
     @property
@@ -62,38 +63,55 @@ class _BlockCache:
         return FunctionalBlock(self._block)
 
     def put(self, block: BlockType, transaction: _Transaction) -> None:
-        update = partial(self._chunk.set_block, self._position_in_chunk, block)
-        transaction.append(self._position, block, update)
+        transaction.append(self._position, block, partial(self._update, block))
         self._block = block
 
+    def _update(self, block: Block) -> None:
+        # look up the chunk again, as it may have been evicted from the cache since it was read
+        chunk, position_in_chunk = self._producer(self._position)
+        chunk.set_block(position_in_chunk, block)
+
 
 class Space:
 
     def __init__(self, generator: SpaceGenerator, store: DataStore) -> None:
         self._store = store
         self._generator = generator
-        self._cache = {}  # type: Dict[ChunkPosition, Chunk]
+        self._cache = OrderedDict()  # type: Dict[ChunkPosition, Chunk]  # least recently used first
+        self._cache_size = get_value(ConfigKey.CHUNK_CACHE_SIZE)
 
     def init_space(self) -> None:
         self._generator.generate_space()
 
     def save(self) -> None:
-        for position, chunk in self._cache.items():
-            if chunk.is_updated:
-                self._store.save_chunk(position, chunk)
-                chunk.is_updated = False
+        updated = [(position, chunk) for position, chunk in self._cache.items() if chunk.is_updated]
+        self._store.save_chunks(updated)
+        for _, chunk in updated:
+            chunk.is_updated = False
+
+    def _save_chunk(self, position: ChunkPosition, chunk: Chunk) -> None:
+        if chunk.is_updated:
+            self._store.save_chunk(position, chunk)
+            chunk.is_updated = False
 
     def get_chunk(self, request: ChunkPositionWithDistance) -> Chunk:
-        if request.position in self._cache:
-            return self._cache[request.position]
+        chunk = self._cache.get(request.position)
+        if chunk is not None:
+            self._cache.move_to_end(request.position)
+            return chunk
         chunk = self._generator.generate_chunk(request)
-        # TODO save when cache is full
         self._cache[request.position] = chunk
+        if self._cache_size is not None and len(self._cache) > self._cache_size:
+            self._save_chunk(*self._cache.popitem(last=False))
         return chunk
 
     def _to_local(self, position: Vector3) -> Tuple[Chunk, Vector3]:
         chunk_position = ChunkPosition.at(position)
-        chunk = self.get_chunk(ChunkPositionWithDistance(0, chunk_position))
+        chunk = self._cache.get(chunk_position)
+        if chunk is None:
+            chunk = self.get_chunk(ChunkPositionWithDistance(0, chunk_position))
+        else:
+            self._cache.move_to_end(chunk_position)
         position_in_chunk = to_local_position(position)
         return chunk, position_in_chunk
 
@@ -43,10 +43,33 @@ class PacketCodec:
         :param id_encoder: a DataCodec to write packet ID
         :return: bytes data obtained by encoding
         """
+        data = bytearray()
+        self.encode_into(packet, data, context, id_encoder)
+        return bytes(data)
+
+    def encode_into(
+            self,
+            packet: ValueObject,
+            data: bytearray,
+            context: CompositeCodecContext=None,
+            id_encoder: DataCodec[int]=None
+    ) -> None:
+        """ Encode packet and append it to data.
+
+        >>> p = _packet_factory.create(PacketType.pong, 8721, 12985, 'MCPE;')
+        >>> data = bytearray(b'\\xff')
+        >>> _packet_codec.encode_into(p, data, None, BYTE_DATA)
+        >>> hexlify(data)
+        b'ff1c000000000000221100000000000032b900054d4350453b'
+
+        :param packet: encoding target
+        :param data: bytes data obtained by encoding is appended to this
+        :param context: if context is None then create a DataCodecContext
+        :param id_encoder: a DataCodec to write packet ID
+        """
         id_encoder = id_encoder or BYTE_DATA
         context = context or CompositeCodecContext()
         context.push_stack()
-        data = bytearray()
         packet_id = self._packet_id_cls(packet[0])
         id_encoder.write(data, packet_id.value, context)
         context.append_value(packet_id)
@@ -57,7 +80,6 @@ class PacketCodec:
             except Exception as exc:
                 raise PacketCodecError(packet_id.name, value) from exc
         context.pop_stack()
-        return bytes(data)
 
     def decode(self, data: bytes, context: CompositeCodecContext=None, id_decoder: DataCodec[int]=None) -> ValueObject:
         """ Decode bytes to packet.
@@ -132,15 +154,17 @@ class _AddressData(DataCodec[AddressInPacket]):
         6: RawData(16)
     }
 
+    _INVERT_TABLE = bytes(~b & 0xff for b in range(256))  # address bytes are sent with their bits inverted
+
     def read(self, data: bytearray, context: DataCodecContext) -> AddressInPacket:
         ip_version = BYTE_DATA.read(data, context)
-        ipv4_address = bytes(~b & 0xff for b in self._ADDRESS_DATA[ip_version].read(data, context))
+        ipv4_address = self._ADDRESS_DATA[ip_version].read(data, context).translate(self._INVERT_TABLE)
         port = B_SHORT_DATA.read(data, context)
         return AddressInPacket(ip_version, ipv4_address, port)
 
     def write(self, data: bytearray, value: AddressInPacket, context: DataCodecContext) -> None:
         BYTE_DATA.write(data, value.ip_version, context)
-        self._ADDRESS_DATA[value.ip_version].write(data, bytes(~b & 0xff for b in value.address), context)
+        self._ADDRESS_DATA[value.ip_version].write(data, value.address.translate(self._INVERT_TABLE), context)
         B_SHORT_DATA.write(data, value.port, context)
 
 
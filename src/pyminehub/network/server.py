@@ -1,18 +1,27 @@
 import asyncio
 import logging
+from typing import Set
 
 from pyminehub.network.address import Address
 from pyminehub.network.handler import GameDataHandler, SessionNotFound
 
 __all__ = [
     'Server',
-    'ServerProcess'
+    'ServerProcess',
+    'all_tasks'
 ]
 
 
 _logger = logging.getLogger(__name__)
 
 
+def all_tasks(loop: asyncio.AbstractEventLoop) -> Set[asyncio.Task]:
+    """Return the tasks of the loop which are not done yet."""
+    if hasattr(asyncio, 'all_tasks'):  # Python 3.7+, Task.all_tasks was removed in Python 3.9
+        return asyncio.all_tasks(loop)
+    return set(task for task in asyncio.Task.all_tasks(loop) if not task.done())
+
+
 class Server:
 
     def start(self) -> None:
@@ -75,7 +84,7 @@ class ServerProcess:
         loop = asyncio.get_event_loop()
         try:
             if exc_type is None and not self._stopped:
-                tasks = asyncio.Task.all_tasks()
+                tasks = all_tasks(loop)
                 loop.run_until_complete(asyncio.gather(*tasks))  # blocking
         except asyncio.CancelledError:
             pass
@@ -87,7 +96,7 @@ class ServerProcess:
             for server in self._servers:
                 server.terminate()
             try:
-                pending = asyncio.Task.all_tasks()
+                pending = all_tasks(loop)
                 loop.run_until_complete(asyncio.gather(*pending))
             except asyncio.CancelledError:
                 pass
@@ -109,5 +118,5 @@ class ServerProcess:
     def stop(self) -> None:
         _logger.info('Shutdown process is running. Please wait...')
         self._stopped = True
-        for task in asyncio.Task.all_tasks():
+        for task in all_tasks(asyncio.get_event_loop()):
             task.cancel()
@@ -171,12 +171,24 @@ raknet_packet_codec = PacketCodec(RakNetPacketType, raknet_packet_factory, _pack
 raknet_frame_codec = PacketCodec(RakNetFrameType, raknet_frame_factory, _frame_data_codecs)
 
 
-def split_frame_set(payload: bytes) -> List[bytes]:
+def split_frame_set(payload: bytes, context: CompositeCodecContext=None) -> List[bytes]:
+    """Decode frames in payload of FRAME_SET packet.
+
+    :param payload: payload of FRAME_SET packet
+    :param context: it is cleared and reused for each frame, if it is not None
+    :return: frames
+    """
     frames = []
-    context = CompositeCodecContext()
-    while len(payload) > 0:
-        frames.append(raknet_frame_codec.decode(payload, context))
-        payload = payload[context.length:]
+    if context is None:
+        context = CompositeCodecContext()
+    else:
+        context.clear()
+    view = memoryview(payload)  # slicing a view does not copy the rest of payload
+    offset = 0
+    payload_length = len(payload)
+    while offset < payload_length:
+        frames.append(raknet_frame_codec.decode(view[offset:], context))
+        offset += context.length
         context.clear()
     return frames
 
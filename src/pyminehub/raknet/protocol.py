@@ -1,12 +1,15 @@
 import asyncio
+from functools import partial
 from logging import getLogger
+from typing import Callable, Dict
 
+from pyminehub.binutil.composite import CompositeCodecContext
 from pyminehub.network.address import Address
 from pyminehub.network.handler import GameDataHandler, Protocol, SessionNotFound, Reliability
 from pyminehub.raknet.codec import raknet_packet_codec, split_frame_set
-from pyminehub.raknet.packet import RakNetPacket
+from pyminehub.raknet.packet import RakNetPacketType, RakNetPacket
 from pyminehub.raknet.session import Session
-from pyminehub.value import LogString
+from pyminehub.value import LogString, HexString
 
 __all__ = [
     'AbstractRakNetProtocol'
@@ -25,6 +28,12 @@ class AbstractRakNetProtocol(asyncio.DatagramProtocol, Protocol):
         handler.register_protocol(self)
         self.__handler = handler
         self.__transport = None
+        self.__frame_set_context = CompositeCodecContext()  # reused, as datagrams are decoded one by one
+        self.__processors = dict(
+            (packet_type, getattr(self, '_process_' + packet_type.name.lower()))
+            for packet_type in RakNetPacketType
+            if hasattr(self, '_process_' + packet_type.name.lower())
+        )  # type: Dict[RakNetPacketType, Callable[[RakNetPacket, Address], None]]
 
     @property
     def guid(self) -> int:
@@ -41,11 +50,11 @@ class AbstractRakNetProtocol(asyncio.DatagramProtocol, Protocol):
         self.__transport = None
 
     def datagram_received(self, data: bytes, addr: Address) -> None:
-        _logger.debug('%s > %s', addr, data.hex())
+        _logger.debug('%s > %s', addr, HexString(data))
         packet = raknet_packet_codec.decode(data)
         _logger.debug('> %s', LogString(packet))
         try:
-            getattr(self, '_process_' + packet.type.name.lower())(packet, addr)
+            self.__processors[packet.type](packet, addr)
         except SessionNotFound as exc:
             assert exc.addr == addr, '{} != {}'.format(exc.addr, addr)
             _logger.info('%s session is not found.', addr)
@@ -58,14 +67,15 @@ class AbstractRakNetProtocol(asyncio.DatagramProtocol, Protocol):
     def send_to_remote(self, packet: RakNetPacket, addr: Address) -> None:
         _logger.debug('< %s', LogString(packet))
         data = raknet_packet_codec.encode(packet)
-        _logger.debug('%s < %s', addr, data.hex())
+        _logger.debug('%s < %s', addr, HexString(data))
         self.__transport.sendto(data, addr)
 
     def create_session(self, mtu_size: int, addr: Address) -> Session:
+        # partial objects call the bound methods without an extra Python frame
         return Session(
             mtu_size,
-            lambda _data: self.__handler.data_received(_data, addr),
-            lambda _packet: self.send_to_remote(_packet, addr))
+            partial(self.__handler.data_received, addr=addr),
+            partial(self.send_to_remote, addr=addr))
 
     def remove_session(self, addr: Address) -> bool:
         raise NotImplementedError()
@@ -75,7 +85,7 @@ class AbstractRakNetProtocol(asyncio.DatagramProtocol, Protocol):
 
     def _process_frame_set(self, packet: RakNetPacket, addr: Address) -> None:
         session = self.get_session(addr)
-        frames = split_frame_set(packet.payload)
+        frames = split_frame_set(packet.payload, self.__frame_set_context)
         session.frame_received(packet.packet_sequence_num, frames)
 
     def _process_frame_set_0(self, packet: RakNetPacket, addr: Address) -> None:
@@ -3,7 +3,7 @@ import asyncio
 from pyminehub.config import ConfigKey, get_value
 from pyminehub.network.address import Address, get_unspecified_address, to_packet_format
 from pyminehub.network.handler import GameDataHandler, SessionNotFound
-from pyminehub.network.server import Server
+from pyminehub.network.server import Server, all_tasks
 from pyminehub.raknet.packet import RakNetPacketType, RakNetPacket, raknet_packet_factory
 from pyminehub.raknet.protocol import AbstractRakNetProtocol
 from pyminehub.raknet.session import Session
@@ -23,6 +23,13 @@ class _RakNetServerProtocol(AbstractRakNetProtocol, asyncio.DatagramProtocol):
             get_value(ConfigKey.WORLD_NAME),
             get_value(ConfigKey.GAME_MODE).title()
         )
+        # responses to connection requests differ only in fields copied from the requests
+        self._pong_template = raknet_packet_factory.create(
+            RakNetPacketType.UNCONNECTED_PONG, 0, self.guid, True, self.server_id)
+        self._reply1_template = raknet_packet_factory.create(
+            RakNetPacketType.OPEN_CONNECTION_REPLY1, True, self.guid, False, 0)
+        self._reply2_template = raknet_packet_factory.create(
+            RakNetPacketType.OPEN_CONNECTION_REPLY2, True, self.guid, None, 0, False)
 
     def terminate(self) -> None:
         super().terminate()
@@ -30,29 +37,26 @@ class _RakNetServerProtocol(AbstractRakNetProtocol, asyncio.DatagramProtocol):
             session.close()
 
     def remove_session(self, addr: Address) -> bool:
-        if addr in self._sessions:
-            self._sessions[addr].close()
-            del self._sessions[addr]
-            return True
-        else:
+        session = self._sessions.pop(addr, None)
+        if session is None:
             return False
+        session.close()
+        return True
 
     def get_session(self, addr: Address) -> Session:
-        try:
-            return self._sessions[addr]
-        except KeyError:
+        session = self._sessions.get(addr)
+        if session is None:
             raise SessionNotFound(addr)
+        return session
 
     def _process_unconnected_ping(self, packet: RakNetPacket, addr: Address) -> None:
-        res_packet = raknet_packet_factory.create(
-            RakNetPacketType.UNCONNECTED_PONG, packet.time_since_start, self.guid, True, self.server_id)
+        res_packet = self._pong_template._replace(time_since_start=packet.time_since_start)
         self.send_to_remote(res_packet, addr)
 
     def _process_open_connection_request1(self, packet: RakNetPacket, addr: Address) -> None:
         if addr in self._sessions and self._sessions[addr].is_closed:
             return  # wait for session closing
-        res_packet = raknet_packet_factory.create(
-            RakNetPacketType.OPEN_CONNECTION_REPLY1, True, self.guid, False, packet.mtu_size)
+        res_packet = self._reply1_template._replace(mtu_size=packet.mtu_size)
         self.send_to_remote(res_packet, addr)
         if addr not in self._sessions:
             self._sessions[addr] = self.create_session(packet.mtu_size, addr)
@@ -60,8 +64,7 @@ class _RakNetServerProtocol(AbstractRakNetProtocol, asyncio.DatagramProtocol):
             assert not self._sessions[addr].is_closed
 
     def _process_open_connection_request2(self, packet: RakNetPacket, addr: Address) -> None:
-        res_packet = raknet_packet_factory.create(
-            RakNetPacketType.OPEN_CONNECTION_REPLY2, True, self.guid, to_packet_format(addr), packet.mtu_size, False)
+        res_packet = self._reply2_template._replace(client_address=to_packet_format(addr), mtu_size=packet.mtu_size)
         self.send_to_remote(res_packet, addr)
         self._sessions[addr].reset(packet.mtu_size)
 
@@ -141,7 +144,7 @@ if __name__ == '__main__':
         pass
     finally:
         server.terminate()
-        pending = asyncio.Task.all_tasks()
+        pending = all_tasks(_loop)
         try:
             _loop.run_until_complete(asyncio.gather(*pending))
         except asyncio.CancelledError:
@@ -1,13 +1,14 @@
 from enum import Enum
-from typing import Callable, Dict, Iterable, NamedTuple, Sequence, Tuple, Union
+from typing import Callable, Dict, Iterable, NamedTuple, Optional, Sequence, Tuple, Union
 
-from pyminehub.config import ConfigKey, get_value
+from pyminehub.config import ConfigKey, add_listener
 
 __all__ = [
     'ValueType',
     'ValueObject',
     'ValueObjectFactory',
-    'LogString'
+    'LogString',
+    'HexString'
 ]
 
 
@@ -37,12 +38,13 @@ class ValueObjectFactory:
         self._factory = dict(
             (
                 value_type,
-                self._create_namedtuple_factory(module_globals, value_type, field_names, cls_prefix)
+                self._create_namedtuple(module_globals, value_type, field_names, cls_prefix)
             )
-            for value_type, field_names in value_specs.items())
+            for value_type, field_names in value_specs.items()
+        )  # type: Dict[ValueType, Callable[..., ValueObject]]
 
     @staticmethod
-    def _create_namedtuple_factory(
+    def _create_namedtuple(
             module_globals: Dict,
             value_type: ValueType,
             field_names: Iterable[Tuple[str, type]],
@@ -53,24 +55,35 @@ class ValueObjectFactory:
         cls = NamedTuple(cls_name, field_names)
         cls.__module__ = module_globals['__name__']  # for pickle
         module_globals[cls_name] = cls  # for pickle
-
-        def namedtuple_factory(*args, **kwargs) -> ValueObject:
-            try:
-                # noinspection PyCallingNonCallable
-                return cls(*args, **kwargs)
-            except TypeError as exc:
-                exc.args = ('{}.{}'.format(cls_name, exc.args[0]), )
-                raise exc
-
-        return namedtuple_factory
+        return cls
 
     def create(self, value_type: ValueType, *args, **kwargs) -> ValueObject:
         """Create value object.
 
         >>> factory.create(PacketType.pong, 8721, 5065, True, 'MCPE;')
         Pong(type=<PacketType.pong: 28>, time=8721, guid=5065, is_valid=True, server_id='MCPE;')
+        >>> factory.create(PacketType.pong, 8721)  # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+          ...
+        TypeError: Pong...
         """
-        return self._factory[value_type](value_type, *args, **kwargs)
+        cls = self._factory[value_type]
+        try:
+            return cls(value_type, *args, **kwargs)
+        except TypeError as exc:
+            exc.args = ('{}.{}'.format(cls.__name__, exc.args[0]), )
+            raise exc
+
+
+_max_log_length = None  # type: Optional[int]
+
+
+def _set_max_log_length(max_length: Optional[int]) -> None:
+    global _max_log_length
+    _max_log_length = max_length
+
+
+add_listener(ConfigKey.MAX_LOG_LENGTH, _set_max_log_length)
 
 
 class LogString:
@@ -80,8 +93,22 @@ class LogString:
         self._value = value
 
     def __str__(self) -> str:
-        max_length = get_value(ConfigKey.MAX_LOG_LENGTH)
-        return str(self._value) if max_length is None else str(self._value)[:max_length]
+        value = str(self._value)
+        return value if _max_log_length is None else value[:_max_log_length]
+
+
+class HexString:
+    """For lazy evaluation when logging.
+
+    >>> str(HexString(b'\\x01\\xab'))
+    '01ab'
+    """
+
+    def __init__(self, value: bytes) -> None:
+        self._value = value
+
+    def __str__(self) -> str:
+        return self._value.hex()
 
 
 if __name__ == '__main__':
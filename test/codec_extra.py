@@ -1,5 +1,7 @@
 from testcase.codec import *
 
+from pyminehub.network.codec import PacketCodecError
+
 
 class CodecExtraTestCase(CodecTestCase):
 
@@ -17,6 +19,13 @@ class CodecExtraTestCase(CodecTestCase):
         )
         assertion.is_correct_on(self, and_verified_with_encoded_data=True)
 
+    def test_update_block_with_unknown_block_id(self):
+        # block IDs in the gaps of BlockType and out of its range
+        for block_id in ('ef01', '8002'):
+            with self.assertRaises(PacketCodecError) as cm:
+                game_packet_codec.decode(unhex('150000000000' + block_id + '00'))
+            self.assertIsInstance(cm.exception.__cause__, ValueError)
+
 
 if __name__ == '__main__':
     import unittest
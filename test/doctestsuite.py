@@ -24,6 +24,7 @@ class DocTestCase(unittest.TestCase):
             'pyminehub/mcpe/plugin/loader',
             'pyminehub/mcpe/item/spec',
             'pyminehub/mcpe/block/spec',
+            'pyminehub/mcpe/block/functional',
             'pyminehub/mcpe/network/codec/connection',
         ]
         for path in module_path:
@@ -0,0 +1,27 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from pyminehub.mcpe import const_int
+from tool.constint import generate_const_int
+
+
+class GeneratedConstTestCase(TestCase):
+
+    def test_const_int(self):
+        with open(const_int.__file__, 'r') as file:
+            expected = file.read()
+        fd, file_name = tempfile.mkstemp(suffix='.py')
+        os.close(fd)
+        try:
+            generate_const_int(file_name)
+            with open(file_name, 'r') as file:
+                actual = file.read()
+        finally:
+            os.remove(file_name)
+        self.assertEqual(expected, actual, 'Regenerate const_int.py by tool.constint module')
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
@@ -13,6 +13,7 @@ from pyminehub.mcpe.command.api import CommandRegistry
 from pyminehub.mcpe.event import Event
 from pyminehub.mcpe.network import MCPEServerHandler
 from pyminehub.network.address import Address
+from pyminehub.network.server import all_tasks
 from pyminehub.raknet.frame import RakNetFrame as _RakNetFrame
 # noinspection PyProtectedMember
 from pyminehub.raknet.server import _RakNetServerProtocol
@@ -71,7 +72,7 @@ class _ProtocolProxy:
     @staticmethod
     def close() -> None:
         loop = asyncio.get_event_loop()
-        pending = asyncio.Task.all_tasks()
+        pending = all_tasks(loop)
         for task in pending:
             task.cancel()
         try:
@@ -0,0 +1,77 @@
+from typing import Optional
+from unittest import TestCase
+
+from pyminehub import config
+from pyminehub.mcpe.chunk import Chunk, create_empty_chunk, decode_chunk, encode_chunk
+from pyminehub.mcpe.const import BlockType
+from pyminehub.mcpe.geometry import ChunkPosition, ChunkPositionWithDistance, Vector3
+from pyminehub.mcpe.value import Block
+from pyminehub.mcpe.world.generator import SpaceGenerator
+from pyminehub.mcpe.world.space import Space, _Transaction
+from util.mock import MockDataStore
+
+
+class _EncodingDataStore(MockDataStore):
+    """Keep encoded chunks, so that a chunk is not shared between the store and the cache."""
+
+    def save_chunk(self, position: ChunkPosition, chunk: Chunk, insert_only=False) -> None:
+        self._save(position, encode_chunk(chunk), self._chunk, insert_only)
+
+    def load_chunk(self, position: ChunkPosition) -> Optional[Chunk]:
+        data = self._load(position, self._chunk)
+        return decode_chunk(data) if data is not None else None
+
+
+class _EmptySpaceGenerator(SpaceGenerator):
+
+    def __init__(self, store: MockDataStore) -> None:
+        self._store = store
+
+    def generate_space(self) -> None:
+        pass
+
+    def generate_chunk(self, request: ChunkPositionWithDistance) -> Chunk:
+        chunk = self._store.load_chunk(request.position)
+        return chunk if chunk is not None else create_empty_chunk()
+
+
+class WorldSpaceTestCase(TestCase):
+
+    _STONE = Block.create(BlockType.STONE, 0)
+
+    def setUp(self) -> None:
+        config.set_config(chunk_cache_size=1)
+        self._store = _EncodingDataStore()
+        self._space = self._create_space()
+
+    def tearDown(self) -> None:
+        config.reset()
+
+    def _create_space(self) -> Space:
+        return Space(_EmptySpaceGenerator(self._store), self._store)
+
+    def _get_block(self, space: Space, position: Vector3[int]) -> Block:
+        chunk, position_in_chunk = space._to_local(position)
+        return chunk.get_block(position_in_chunk)
+
+    def test_save_evicted_chunk(self):
+        position = Vector3(0, 0, 0)
+        transaction = _Transaction()
+        self._space._get_cache(position).put(self._STONE, transaction)
+        list(transaction.commit())
+        self._space.get_chunk(ChunkPositionWithDistance(0, ChunkPosition(1, 0)))  # evict the updated chunk
+        self.assertEqual(self._STONE, self._get_block(self._create_space(), position))
+
+    def test_evict_chunk_in_transaction(self):
+        position = Vector3(0, 0, 0)
+        transaction = _Transaction()
+        self._space._get_cache(position).put(self._STONE, transaction)
+        self._space._get_cache(Vector3(16, 0, 0))  # evict the chunk that is updated by the transaction
+        list(transaction.commit())
+        self._space.save()
+        self.assertEqual(self._STONE, self._get_block(self._create_space(), position))
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
@@ -10,6 +10,7 @@ from pyminehub.mcpe.geometry import Vector3, Face
 from pyminehub.mcpe.plugin.loader import get_plugin_loader
 from pyminehub.mcpe.value import *
 from pyminehub.mcpe.world import run
+from pyminehub.network.server import all_tasks
 from util.mock import MockDataStore
 
 
@@ -26,7 +27,7 @@ class WorldSurvivalTestCase(TestCase):
         self._world.terminate()
         loop = asyncio.get_event_loop()
         try:
-            pending = asyncio.Task.all_tasks()
+            pending = all_tasks(loop)
             loop.run_until_complete(asyncio.gather(*pending))
         except asyncio.CancelledError:
             pass
@@ -0,0 +1,32 @@
+from enum import IntEnum
+
+from pyminehub.mcpe import const
+
+_HEADER = '''"""Integer mirror of IntEnum members in pyminehub.mcpe.const
+
+Generated by tool.constint module. Do not edit by hand.
+"""
+'''
+
+
+def int_enum_classes():
+    for name in const.__all__:
+        value = getattr(const, name)
+        if isinstance(value, type) and issubclass(value, IntEnum):
+            yield value
+
+
+def generate_const_int(file_name: str) -> None:
+    """For example, pyminehub/mcpe/const_int.py is generated by this."""
+    lines = [_HEADER]
+    for enum_cls in int_enum_classes():
+        lines.append('')
+        for member in enum_cls:
+            lines.append('{}_{} = {}'.format(enum_cls.__name__, member.name, member.value))
+    with open(file_name, 'w') as file:
+        file.write('\n'.join(lines) + '\n')
+
+
+if __name__ == '__main__':
+    import sys
+    generate_const_int(sys.argv[1])
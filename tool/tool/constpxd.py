@@ -0,0 +1,23 @@
+from tool.constint import int_enum_classes
+
+_HEADER = '''# Cython declarations of IntEnum classes in pyminehub.mcpe.const
+#
+# Generated by tool.constpxd module. Do not edit by hand.
+'''
+
+
+def generate_const_pxd(file_name: str) -> None:
+    """For example, pyminehub/mcpe/const.pxd is generated by this."""
+    lines = [_HEADER]
+    for enum_cls in int_enum_classes():
+        lines.append('')
+        lines.append('cdef enum {}:'.format(enum_cls.__name__))
+        for member in enum_cls:
+            lines.append('    {}_{} = {}'.format(enum_cls.__name__, member.name, member.value))
+    with open(file_name, 'w') as file:
+        file.write('\n'.join(lines) + '\n')
+
+
+if __name__ == '__main__':
+    import sys
+    generate_const_pxd(sys.argv[1])
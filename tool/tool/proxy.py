@@ -76,7 +76,10 @@ def run():
     except KeyboardInterrupt:
         pass
     finally:
-        pending = asyncio.Task.all_tasks()
+        if hasattr(asyncio, 'all_tasks'):  # Python 3.7+, Task.all_tasks was removed in Python 3.9
+            pending = asyncio.all_tasks(loop)
+        else:
+            pending = asyncio.Task.all_tasks(loop)
         try:
             loop.run_until_complete(asyncio.gather(*pending))
         except asyncio.CancelledError: